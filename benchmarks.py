@@ -0,0 +1,253 @@
+"""Benchmarks for the AI and rendering hot paths, compared against a saved JSON baseline"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+import engine
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+DENSITIES = [0, 5, 10, 15, 20]  # Snakes plus ladders, up to Board.max_elements
+PLAYER_POSITION = 30  # Player cell the benchmark layouts are built around
+SNAKE_SHARE = 0.6  # Fraction of a layout's elements that are snakes
+
+def build_board(board_class, difficulty, density, seed=0, snake_share=SNAKE_SHARE):
+    """Board for a difficulty with density random snakes and ladders"""
+    rng = random.Random(seed)
+    random.seed(seed)
+    board = board_class()
+    board.configure_difficulty(difficulty)
+    board.current_position = PLAYER_POSITION
+
+    used = {1, 100}
+    num_snakes = round(density * snake_share)
+    while len(board.snakes) + len(board.ladders) < density:
+        start = rng.randint(2, 99)
+        if len(board.snakes) < num_snakes:
+            end = rng.randint(max(1, start - 30), start - 1)
+        elif start < 99:
+            end = rng.randint(start + 1, min(99, start + 30))
+        else:
+            continue
+        if start in used or end in used:
+            continue
+        used.update((start, end))
+        if len(board.snakes) < num_snakes:
+            board.add_snake(start, end)
+        else:
+            board.add_ladder(start, end)
+    return board
+
+def measure(run, setup=None, min_time=0.2, repeat=5):
+    """Best-of-repeat milliseconds per call of run(state), with setup() excluded from the timing"""
+    rounds = []
+    for _ in range(repeat):
+        calls = 0
+        elapsed = 0.0
+        while calls == 0 or elapsed < min_time / repeat:
+            state = setup() if setup else None
+            start = time.perf_counter()
+            run(state)
+            elapsed += time.perf_counter() - start
+            calls += 1
+        rounds.append(elapsed / calls * 1000)
+    return min(rounds)
+
+# AI benchmarks, each returning (setup, run) for a difficulty and layout density
+
+def bench_monte_carlo_simulation(difficulty, density):
+    board = build_board(engine.Board, difficulty, density)
+    return None, lambda _: board.monte_carlo_simulation(PLAYER_POSITION)
+
+def bench_minimax(difficulty, density):
+    board = build_board(engine.Board, difficulty, density)
+    depth = board.difficulty_settings[difficulty]["minimax_depth"]
+
+    def setup():
+        # Every call searches from a cold transposition table
+        board.transposition_table.clear()
+
+    return setup, lambda _: board.minimax(PLAYER_POSITION, depth)
+
+def placement_setup(difficulty, density, budget_ms):
+    """setup() building a fresh board per call, with search_budget_ms set to budget_ms"""
+    seeds = iter(range(10 ** 9))
+
+    def setup():
+        board = build_board(engine.Board, difficulty, density, next(seeds) % 50)
+        board.difficulty_settings[difficulty]["search_budget_ms"] = budget_ms
+        return board
+
+    return setup
+
+def bench_add_adaptive_placements(difficulty, density):
+    # Fixed-depth search, a budgeted search always stops at its deadline
+    return placement_setup(difficulty, density, None), lambda board: board.add_adaptive_placements()
+
+def bench_add_adaptive_placements_budgeted(difficulty, density):
+    # The difficulty's own thinking time, tracks the overhead around the deadline
+    budget_ms = engine.Board().difficulty_settings[difficulty]["search_budget_ms"]
+    return placement_setup(difficulty, density, budget_ms), lambda board: board.add_adaptive_placements()
+
+def bench_find_optimal_ladder_placement(difficulty, density):
+    board = build_board(engine.Board, difficulty, density)
+    return None, lambda _: board.find_optimal_ladder_placement()
+
+def bench_evaluate_position(difficulty, density):
+    board = build_board(engine.Board, difficulty, density)
+
+    def run(_):
+        # One call evaluates every cell, single evaluations are too quick to time
+        for position in range(1, 100):
+            board.evaluate_position(position)
+
+    return None, run
+
+# Rendering benchmarks, these open a (dummy if headless) pygame display
+
+def load_renderer():
+    """Import the pygame front-end, on the dummy video driver when there is no display"""
+    if "DISPLAY" not in os.environ and "WAYLAND_DISPLAY" not in os.environ:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import final
+    if final.screen is None:
+        final.init_display()
+    final.BACKGROUND_AI = False
+    return final
+
+def bench_board_draw(difficulty, density):
+    final = load_renderer()
+    board = build_board(final.Board, difficulty, density)
+    return None, lambda _: board.draw()
+
+def bench_draw_ladders(difficulty, density):
+    final = load_renderer()
+    # Every element is a ladder here, so density is the ladder count
+    board = build_board(final.Board, difficulty, density, snake_share=0)
+    ladders = [(board.get_coordinates(start), board.get_coordinates(end))
+               for start, end in board.ladders.items()]
+
+    def run(_):
+        for (x1, y1), (x2, y2) in ladders:
+            board.draw_ladder(x1, y1, x2, y2)
+
+    return None, run
+
+def bench_draw_power_ups(difficulty, density):
+    final = load_renderer()
+    player = final.Player(final.PLAYER_COLOR, "Player")
+    for power_up in list(engine.POWER_UPS)[:player.max_power_ups]:
+        player.add_power_up(power_up)
+
+    return None, lambda _: player.draw_power_ups()
+
+def bench_confetti(difficulty, density):
+    final = load_renderer()
+    # Each density step is 500 particles, so density 20 is the 10k particle target
+    confetti = final.Confetti(max(final.CONFETTI_PARTICLES, density * 500), [final.PRIMARY, final.ACCENT])
+
+    def run(_):
+        confetti.update()
+        confetti.draw(final.screen)
+
+    return None, run
+
+def bench_game_draw(difficulty, density):
+    final = load_renderer()
+    game = final.Game()
+    game.start_game(difficulty)
+    game.board = build_board(final.Board, difficulty, density)
+    game.player.position = game.player.current_display_pos = PLAYER_POSITION
+    game.set_message("Benchmark")
+    return None, lambda _: game.draw()
+
+BENCHMARKS = {
+    "monte_carlo_simulation": bench_monte_carlo_simulation,
+    "minimax": bench_minimax,
+    "add_adaptive_placements": bench_add_adaptive_placements,
+    "add_adaptive_placements_budgeted": bench_add_adaptive_placements_budgeted,
+    "find_optimal_ladder_placement": bench_find_optimal_ladder_placement,
+    "evaluate_position": bench_evaluate_position,
+    "board_draw": bench_board_draw,
+    "draw_ladders": bench_draw_ladders,
+    "draw_power_ups": bench_draw_power_ups,
+    "confetti": bench_confetti,
+    "game_draw": bench_game_draw,
+}
+
+def run_benchmarks(names, difficulties, densities, min_time):
+    """Time every selected benchmark, {"name[difficulty,density]": ms per call}"""
+    results = {}
+    for name in names:
+        for difficulty in difficulties:
+            for density in densities:
+                key = f"{name}[{difficulty},{density}]"
+                # The AI logs every placement, keep that out of the report
+                with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                    setup, run = BENCHMARKS[name](difficulty, density)
+                    results[key] = measure(run, setup, min_time)
+                print(f"{key:<50} {results[key]:10.4f} ms", file=sys.stderr)
+    return results
+
+def report(results, baseline, threshold):
+    """Print each result against the baseline, returning the number of regressions"""
+    regressions = 0
+    print(f"{'benchmark':<50} {'ms':>10} {'baseline':>10} {'change':>8}")
+    for key, value in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<50} {value:10.4f} {'-':>10} {'new':>8}")
+            continue
+        change = (value - base) / base if base else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change < -threshold:
+            flag = "  improved"
+        print(f"{key:<50} {value:10.4f} {base:10.4f} {change:+8.1%}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bench", action="append", choices=sorted(BENCHMARKS),
+                        help="Benchmark to run, repeat for several (default: all)")
+    parser.add_argument("--difficulty", action="append", choices=DIFFICULTIES,
+                        help="Difficulty to run, repeat for several (default: all)")
+    parser.add_argument("--density", action="append", type=int,
+                        help="Layout density to run, repeat for several (default: 0 5 10 15 20)")
+    parser.add_argument("--baseline", default="benchmarks_baseline.json", help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Slowdown reported as a regression")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds spent timing each case")
+    parser.add_argument("--no-render", action="store_true", help="Skip the pygame rendering benchmarks")
+    args = parser.parse_args()
+
+    names = args.bench or list(BENCHMARKS)
+    if args.no_render:
+        names = [name for name in names if name not in ("board_draw", "draw_ladders", "draw_power_ups", "confetti", "game_draw")]
+    results = run_benchmarks(names, args.difficulty or DIFFICULTIES, args.density or DENSITIES, args.min_time)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    regressions = report(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "results": {**baseline, **results}
+            }, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+    elif regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1701 @@
+"""Snakes and Ladders rules, AI and game state, with no pygame or display dependency"""
+import random
+import time
+import bisect
+import queue
+import struct
+import threading
+from collections import defaultdict, OrderedDict, namedtuple
+
+GRID_SIZE = 10
+
+# Difficulty settings
+DIFFICULTY_TIMES = {
+    "easy": 120,    # 2 minutes in seconds
+    "medium": 60,  # 1  minutes 20 in seconds
+    "hard": 30,    # 5 minutes in seconds
+}
+
+# Dice weights the AI assumes for the player's rolls on each difficulty
+DICE_WEIGHTS = {
+    "easy": [0.03, 0.07, 0.15, 0.2, 0.25, 0.3],    # Favor higher numbers
+    "medium": [1/6] * 6,                           # Equal probability
+    "hard": [0.3, 0.25, 0.2, 0.15, 0.07, 0.03]     # Favor lower numbers
+}
+
+# Zobrist keys for hashing snake and ladder layouts, indexed [start][end]
+def _zobrist_table(rng):
+    """101x101 table of random 64-bit keys, unpacked from one block of random bytes"""
+    keys = struct.unpack(f"<{101 * 101}Q", rng.randbytes(8 * 101 * 101))
+    return [list(keys[row * 101:(row + 1) * 101]) for row in range(101)]
+
+_zobrist_rng = random.Random(0x5AE5)
+ZOBRIST_SNAKE_KEYS = _zobrist_table(_zobrist_rng)
+ZOBRIST_LADDER_KEYS = _zobrist_table(_zobrist_rng)
+
+# Evaluation weight of each snake and ladder per difficulty
+EVALUATION_DIFFICULTY_FACTORS = {
+    "easy": 0.5,
+    "medium": 1.0,
+    "hard": 1.5
+}
+LADDER_BYPASS_FACTOR = 0.7  # Ladders spanning a snake head are worth less
+
+class SearchTimeout(Exception):
+    """Raised inside a placement search when its deadline has passed or it was cancelled"""
+
+class DiceModel:
+    """Dice distribution compiled once per difficulty for sampling and roll-sum lookups"""
+    def __init__(self, weights):
+        total_weight = sum(weights)
+        self.probabilities = [weight / total_weight for weight in weights]
+        self.outcomes = list(enumerate(self.probabilities, start=1))  # (face, probability)
+        
+        # Cumulative weights for sampling with one uniform draw
+        self.cumulative = []
+        running = 0.0
+        for prob in self.probabilities:
+            running += prob
+            self.cumulative.append(running)
+        self.cumulative[-1] = 1.0
+        self.np_cumulative = None  # NumPy copy of cumulative, built on first sample_array
+        
+        # Distribution of the sum of k rolls, {k: {sum: probability}}
+        self.roll_sum_tables = {0: {0: 1.0}}
+        
+    def sample(self, rng=random):
+        """Draw one roll"""
+        return bisect.bisect_right(self.cumulative, rng.random()) + 1
+        
+    def sample_array(self, np_rng, shape):
+        """Draw an array of rolls with a NumPy generator"""
+        import numpy as np
+        if self.np_cumulative is None:
+            self.np_cumulative = np.array(self.cumulative)
+        return np.searchsorted(self.np_cumulative, np_rng.random(shape), side="right") + 1
+        
+    def roll_sums(self, k):
+        """Probability of each total after k rolls, convolved once and cached"""
+        table = self.roll_sum_tables.get(k)
+        if table is None:
+            previous = self.roll_sums(k - 1)
+            table = defaultdict(float)
+            for total, prob in previous.items():
+                for face, face_prob in self.outcomes:
+                    table[total + face] += prob * face_prob
+            table = self.roll_sum_tables[k] = dict(table)
+        return table
+
+# Immutable copy of everything the placement AI reads from a Board
+BoardSnapshot = namedtuple("BoardSnapshot", [
+    "difficulty", "settings", "snakes", "ladders", "current_position", "layout_hash"
+])
+
+
+# Processes scoring root placement candidates in parallel, 0 or 1 to search in-process
+ROOT_SEARCH_WORKERS = 0
+
+# Transposition table bound flags
+TT_EXACT = 0
+TT_LOWER = 1  # Stored value is a lower bound (search failed high)
+TT_UPPER = 2  # Stored value is an upper bound (search failed low)
+
+# Power-up types and their effects
+POWER_UPS = {
+    "time_boost": {
+        "name": "Time Boost",
+        "description": "Adds 5 seconds to the timer",
+        "effect": lambda game: game.add_time(5)  # Use a method instead of direct attribute change
+    },
+    "snake_killer": {
+        "name": "Snake Killer",
+        "description": "Removes a random snake from the board",
+        "effect": lambda game: game.board.remove_random_snake()
+    },
+    "immunity": {
+        "name": "Immunity",
+        "description": "Protects from next snake bite",
+        "effect": lambda game: setattr(game.player, 'has_immunity', True)
+    }
+}
+
+class Player:
+    def __init__(self, name="Player"):
+        self.position = 1
+        self.name = name
+        self.target_position = 1
+        self.is_moving = False
+        self.move_progress = 0
+        self.win = False
+        self.power_ups = []
+        self.has_immunity = False
+        self.max_power_ups = 3
+        self.moving_down = False
+        self.animation_speed = 0.1
+        self.current_display_pos = 1
+        self.animation_start_pos = 1
+        
+    def move(self, steps):
+        self.animation_start_pos = self.position
+        self.target_position = min(self.position + steps, 100)
+        self.is_moving = True
+        self.move_progress = 0
+        self.moving_down = steps < 0
+        self.animation_speed = 0.1
+        
+    def update_animation(self):
+        if self.is_moving:
+            self.move_progress += self.animation_speed
+            self.current_display_pos = self.animation_start_pos + (self.target_position - self.animation_start_pos) * self.move_progress
+            
+            if self.move_progress >= 1:
+                self.finish_move()
+                return True
+        return False
+        
+    def finish_move(self):
+        """Jump straight to the end of the current move"""
+        self.position = self.target_position
+        self.current_display_pos = self.target_position
+        self.is_moving = False
+
+    def get_current_display_position(self):
+        return self.current_display_pos
+
+    def add_power_up(self, power_up):
+        if len(self.power_ups) < self.max_power_ups:
+            self.power_ups.append(power_up)
+            return True
+        return False
+        
+    def use_power_up(self, index):
+        if 0 <= index < len(self.power_ups):
+            return self.power_ups.pop(index)
+        return None
+
+
+class Board:
+    def __init__(self):
+        # Start with empty snakes and ladders
+        self.clear_layout()
+        self.power_ups = {}  # Dictionary mapping positions to power-up types
+        self.gift_boxes = set()  # Set of positions with gift boxes
+        self.max_power_ups = 5  # Maximum number of power-ups per game
+        
+        # AI adaptive placement system
+        self.roll_history = []  # Store all rolls
+        self.current_position = 1
+        self.ai_enabled = True
+        self.last_placement_position = 1
+        self.placement_threshold = 8  # Reduced: Player must advance this far for new placements
+        self.max_elements = 20  # Maximum combined snakes and ladders
+        self.last_prediction_time = 0
+        self.prediction_interval = 2000  # ms between predictions
+        self.difficulty = "easy"  # Default difficulty
+        self.dice_model = DiceModel(DICE_WEIGHTS[self.difficulty])
+        
+        # Enhanced difficulty settings. Keep search_budget_ms finite for the pygame game:
+        # the background placement thread shares the GIL with the render loop
+        self.difficulty_settings = {
+            "easy": {
+                "early_snake_ratio": 0.4,    # 40% snakes in early game
+                "mid_snake_ratio": 0.6,      # 60% snakes in mid game
+                "late_snake_ratio": 0.7,     # 70% snakes in late game
+                "snake_length_factor": 1.0,   # Base snake length multiplier
+                "ladder_length_factor": 1.0,  # Base ladder length multiplier
+                "minimax_depth": 2,          # Shallow search for easy mode
+                "search_algorithm": "minimax",  # "minimax" or "expectimax" placement search
+                "search_budget_ms": 8,       # Placement thinking time per turn, None for fixed depth
+                "monte_carlo_sims": 500,     # Fewer simulations for easy mode
+                "landing_model": "exact",    # "exact" Markov chain, "sampled" or "numpy" random walks
+                "placement_threshold": 10,    # More frequent placements
+                "snake_aggression": 0.5      # Lower snake aggression
+            },
+            "medium": {
+                "early_snake_ratio": 0.6,    # 60% snakes in early game
+                "mid_snake_ratio": 0.7,      # 70% snakes in mid game
+                "late_snake_ratio": 0.85,    # 85% snakes in late game
+                "snake_length_factor": 1.3,   # 30% longer snakes
+                "ladder_length_factor": 0.8,  # 20% shorter ladders
+                "minimax_depth": 3,          # Medium search depth
+                "search_algorithm": "minimax",  # "minimax" or "expectimax" placement search
+                "search_budget_ms": 12,      # Placement thinking time per turn, None for fixed depth
+                "monte_carlo_sims": 1000,    # More simulations
+                "landing_model": "exact",    # "exact" Markov chain, "sampled" or "numpy" random walks
+                "placement_threshold": 8,     # Balanced placement frequency
+                "snake_aggression": 0.7      # Medium snake aggression
+            },
+            "hard": {
+                "early_snake_ratio": 0.7,    # 70% snakes in early game
+                "mid_snake_ratio": 0.85,     # 85% snakes in mid game
+                "late_snake_ratio": 0.95,    # 95% snakes in late game
+                "snake_length_factor": 1.6,   # 60% longer snakes
+                "ladder_length_factor": 0.6,  # 40% shorter ladders
+                "minimax_depth": 4,          # Deeper search for hard mode
+                "search_algorithm": "expectimax",  # "minimax" or "expectimax" placement search
+                "search_budget_ms": 16,      # Placement thinking time per turn, None for fixed depth
+                "monte_carlo_sims": 2000,    # More simulations for better prediction
+                "landing_model": "exact",    # "exact" Markov chain, "sampled" or "numpy" random walks
+                "placement_threshold": 6,     # More frequent placements
+                "snake_aggression": 0.9      # High snake aggression
+            }
+        }
+        
+        self.initialize_gift_boxes()
+        
+        # Random generator for the NumPy Monte Carlo kernel, NumPy is only imported when it runs
+        self.np_rng = None
+        
+        # Minimax parameters
+        self.transposition_table = OrderedDict()  # (layout hash, position, depth, side) -> (value, flag)
+        self.transposition_table_size = 50000  # Max entries before least recently used are evicted
+        self.candidate_cache = {}  # (layout hash, position) -> expectimax placement candidates
+        self.search_deadline = None  # time.perf_counter() deadline for the running search
+        self.search_cancel = None  # threading.Event (or SharedFlag) that aborts the running search when set
+        self.placement_worker = None  # PlacementWorker computing placements off the main thread
+        self.root_search_workers = ROOT_SEARCH_WORKERS  # Processes scoring root candidates
+        self.last_placement_ms = None  # Wall time of the last adaptive placement search
+    
+    def initialize_gift_boxes(self):
+        """Place initial gift boxes in random cells"""
+        available_cells = set(range(2, 99)) - set(self.snakes.keys()) - set(self.ladders.keys())
+        num_initial_gifts = min(5, len(available_cells))  # Start with 5 gift boxes
+        
+        # Clear existing power-ups
+        self.power_ups.clear()
+        self.gift_boxes.clear()
+        
+        # Place new power-ups
+        for cell in random.sample(list(available_cells), num_initial_gifts):
+            self.add_power_up(cell)
+        # Ladders will be placed dynamically through add_adaptive_placements
+    
+    def configure_difficulty(self, difficulty):
+        """Configure board settings based on difficulty"""
+        if self.placement_worker is not None:
+            self.placement_worker.cancel()
+        self.difficulty = difficulty
+        self.dice_model = DiceModel(DICE_WEIGHTS[difficulty])
+        # Clear any existing elements
+        self.clear_layout()
+        # Cached search results depend on difficulty
+        self.transposition_table.clear()
+        self.candidate_cache.clear()
+    
+    def clear_layout(self):
+        """Remove all snakes and ladders"""
+        self.snakes = {}
+        self.ladders = {}
+        self.layout_hash = 0  # Zobrist hash of the snake and ladder layout
+        
+        # Running evaluation aggregates, see evaluate_position
+        self.snake_score = 0
+        self.ladder_score = 0
+        self.snake_terms = {}  # snake start -> evaluation term
+        self.ladder_terms = {}  # ladder start -> evaluation term before bypass penalty
+        self.ladder_bypass_counts = {}  # ladder start -> snake heads inside its span
+        self.ladders_over_cell = [[] for _ in range(101)]  # cell -> ladders spanning it
+    
+    def rebuild_evaluation_state(self):
+        """Recompute the evaluation aggregates from scratch, e.g. after tuning settings"""
+        snakes, ladders = self.snakes, self.ladders
+        self.clear_layout()
+        for start, end in ladders.items():
+            self.add_ladder(start, end)
+        for start, end in snakes.items():
+            self.add_snake(start, end)
+    
+    def add_snake(self, start, end):
+        """Place a snake and update the layout hash and evaluation state"""
+        if start in self.snakes:
+            self.remove_snake(start)
+        self.snakes[start] = end
+        self.layout_hash ^= ZOBRIST_SNAKE_KEYS[start][end]
+        
+        term = self.snake_evaluation_term(start, end)
+        self.snake_terms[start] = term
+        self.snake_score += term
+        
+        # Ladders spanning this head now bypass a snake
+        for ladder_start in self.ladders_over_cell[start]:
+            self.ladder_bypass_counts[ladder_start] += 1
+            if self.ladder_bypass_counts[ladder_start] == 1:
+                self.ladder_score -= self.ladder_terms[ladder_start] * (1 - LADDER_BYPASS_FACTOR)
+    
+    def remove_snake(self, start):
+        """Remove the snake at start and update the layout hash and evaluation state"""
+        end = self.snakes.pop(start)
+        self.layout_hash ^= ZOBRIST_SNAKE_KEYS[start][end]
+        
+        self.snake_score -= self.snake_terms.pop(start)
+        for ladder_start in self.ladders_over_cell[start]:
+            self.ladder_bypass_counts[ladder_start] -= 1
+            if self.ladder_bypass_counts[ladder_start] == 0:
+                self.ladder_score += self.ladder_terms[ladder_start] * (1 - LADDER_BYPASS_FACTOR)
+        return end
+    
+    def add_ladder(self, start, end):
+        """Place a ladder and update the layout hash and evaluation state"""
+        if start in self.ladders:
+            self.remove_ladder(start)
+        self.ladders[start] = end
+        self.layout_hash ^= ZOBRIST_LADDER_KEYS[start][end]
+        
+        term = self.ladder_evaluation_term(start, end)
+        bypassed = sum(1 for cell in range(start + 1, end) if cell in self.snakes)
+        self.ladder_terms[start] = term
+        self.ladder_bypass_counts[start] = bypassed
+        self.ladder_score += term * LADDER_BYPASS_FACTOR if bypassed else term
+        for cell in range(start + 1, end):
+            self.ladders_over_cell[cell].append(start)
+    
+    def remove_ladder(self, start):
+        """Remove the ladder at start and update the layout hash and evaluation state"""
+        end = self.ladders.pop(start)
+        self.layout_hash ^= ZOBRIST_LADDER_KEYS[start][end]
+        
+        term = self.ladder_terms.pop(start)
+        bypassed = self.ladder_bypass_counts.pop(start)
+        self.ladder_score -= term * LADDER_BYPASS_FACTOR if bypassed else term
+        for cell in range(start + 1, end):
+            self.ladders_over_cell[cell].remove(start)
+        return end
+        
+    def get_current_snake_ratio(self):
+        """Get target snake ratio based on difficulty and player progress"""
+        settings = self.difficulty_settings[self.difficulty]
+        
+        # Determine ratio based on progress
+        if self.current_position < 30:
+            return settings["early_snake_ratio"]
+        elif self.current_position < 70:
+            return settings["mid_snake_ratio"]
+        else:
+            return settings["late_snake_ratio"]
+            
+    def get_element_length_factors(self):
+        """Get length factors for snakes and ladders based on difficulty and progress"""
+        settings = self.difficulty_settings[self.difficulty]
+        progress = self.current_position / 100
+        
+        # Base factors from difficulty
+        snake_factor = settings["snake_length_factor"]
+        ladder_factor = settings["ladder_length_factor"]
+        
+        # Modify factors based on progress (0-100%)
+        # Snakes get longer as player advances
+        progress_snake_boost = 1.0 + (progress * 1.0)  # 1.0-2.0x multiplier
+        # Ladders get shorter as player advances
+        progress_ladder_reduction = 1.0 - (progress * 0.5)  # 1.0-0.5x multiplier
+        
+        return snake_factor * progress_snake_boost, ladder_factor * progress_ladder_reduction
+    
+    def monte_carlo_simulation(self, current_position, num_simulations=None, num_steps=3, model=None):
+        """Predict landing probabilities using the difficulty's landing model"""
+        if model is None:
+            model = self.difficulty_settings[self.difficulty]["landing_model"]
+            
+        if model == "exact":
+            cell_counts = self.exact_landing_distribution(current_position, num_steps)
+        elif model == "sampled":
+            cell_counts = self.sample_landing_counts(current_position, num_simulations, num_steps)
+        elif model == "numpy":
+            cell_counts = self.numpy_landing_counts(current_position, num_simulations, num_steps)
+        else:
+            raise ValueError(f"Unknown landing model: {model}")
+            
+        return self.weight_landing_probabilities(cell_counts)
+    
+    def sample_landing_counts(self, current_position, num_simulations=None, num_steps=3):
+        """Count final positions of random walks with difficulty-based dice"""
+        if num_simulations is None:
+            num_simulations = self.difficulty_settings[self.difficulty]["monte_carlo_sims"]
+            
+        cell_counts = defaultdict(int)
+        
+        for _ in range(num_simulations):
+            pos = current_position
+            steps_taken = 0
+            
+            while steps_taken < num_steps and pos < 100:
+                # Simulate dice roll with the difficulty's weighted dice
+                pos += self.dice_model.sample()
+                steps_taken += 1
+                
+                # Apply existing snakes and ladders
+                if pos in self.snakes:
+                    pos = self.snakes[pos]
+                elif pos in self.ladders:
+                    pos = self.ladders[pos]
+                
+                if pos > 100:
+                    break
+                    
+                # Only count final positions for placement decisions
+                if steps_taken == num_steps:
+                    cell_counts[pos] += 1
+                    
+        return cell_counts
+    
+    def numpy_landing_counts(self, current_position, num_simulations=None, num_steps=3):
+        """Count final positions of all random walks at once with NumPy arrays"""
+        if num_simulations is None:
+            num_simulations = self.difficulty_settings[self.difficulty]["monte_carlo_sims"]
+        if current_position >= 100 or num_simulations <= 0:
+            return {}
+            
+        import numpy as np
+        if self.np_rng is None:
+            self.np_rng = np.random.default_rng()
+            
+        # Pre-sample every roll of every walk
+        dice = self.dice_model.sample_array(self.np_rng, (num_simulations, num_steps))
+        
+        # Cell reached by a roll -> cell the player ends up on (snakes win over ladders)
+        destinations = np.arange(107)
+        for start, end in self.ladders.items():
+            destinations[start] = end
+        for start, end in self.snakes.items():
+            destinations[start] = end
+            
+        pos = np.full(num_simulations, current_position)
+        active = np.ones(num_simulations, dtype=bool)
+        for step in range(num_steps):
+            pos = np.where(active, pos + dice[:, step], pos)
+            # Overshooting 100 ends the walk without a landing
+            active &= pos <= 100
+            pos = destinations[np.minimum(pos, 106)]
+            # Walks that reach 100 early stop there and are not counted
+            if step < num_steps - 1:
+                active &= pos < 100
+                
+        counts = np.bincount(pos[active], minlength=101)
+        return {int(cell): int(counts[cell]) for cell in np.flatnonzero(counts)}
+    
+    def transition_row(self, pos):
+        """One-roll transitions (destination, probability) out of pos"""
+        row = []
+        for dice, weight in self.dice_model.outcomes:
+            dest = pos + dice
+            # Overshooting 100 ends the walk without a landing
+            if dest > 100:
+                continue
+                
+            # Apply existing snakes and ladders
+            if dest in self.snakes:
+                dest = self.snakes[dest]
+            elif dest in self.ladders:
+                dest = self.ladders[dest]
+                
+            row.append((dest, weight))
+        return row
+    
+    def exact_landing_distribution(self, current_position, num_steps=3):
+        """Exact landing distribution after num_steps rolls via Markov chain propagation"""
+        if current_position >= 100:
+            return {}
+            
+        # With no snakes or ladders in reach and no way to reach 100 early,
+        # the landing cells are just the roll-sum distribution shifted
+        furthest = current_position + 6 * num_steps
+        if (current_position + 6 * (num_steps - 1) < 100 and
+                not any(cell in self.snakes or cell in self.ladders
+                        for cell in range(current_position + 1, furthest + 1))):
+            return {current_position + total: prob
+                    for total, prob in self.dice_model.roll_sums(num_steps).items()
+                    if current_position + total <= 100}
+            
+        # Rows of the transition matrix are only built for cells the walk reaches
+        transitions = {}
+        distribution = {current_position: 1.0}
+        
+        for step in range(1, num_steps + 1):
+            next_distribution = defaultdict(float)
+            for pos, prob in distribution.items():
+                row = transitions.get(pos)
+                if row is None:
+                    row = transitions[pos] = self.transition_row(pos)
+                for dest, weight in row:
+                    next_distribution[dest] += prob * weight
+                    
+            # Walks that reach 100 early stop there and are not counted
+            if step < num_steps:
+                next_distribution.pop(100, None)
+            distribution = next_distribution
+            
+        return distribution
+    
+    def weight_landing_probabilities(self, cell_counts):
+        """Convert landing counts to probabilities with difficulty-based weighting"""
+        total_hits = sum(cell_counts.values())
+        if total_hits == 0:
+            return {}
+            
+        # Apply difficulty-based weighting to probabilities
+        weighted_probabilities = {}
+        for cell, count in cell_counts.items():
+            base_prob = count / total_hits
+            # Adjust probability based on difficulty and position
+            if self.difficulty == "hard":
+                # In hard mode, increase probability for positions near snakes
+                if any(abs(cell - snake_pos) < 5 for snake_pos in self.snakes.keys()):
+                    base_prob *= 1.5
+            elif self.difficulty == "easy":
+                # In easy mode, increase probability for positions near ladders
+                if any(abs(cell - ladder_pos) < 5 for ladder_pos in self.ladders.keys()):
+                    base_prob *= 1.5
+                    
+            weighted_probabilities[cell] = base_prob
+            
+        return weighted_probabilities
+    
+    def update_player_position(self, new_position):
+        """Update the player's current position for the AI"""
+        self.current_position = new_position
+        
+        # Placements still being computed for the old position are stale
+        if self.placement_worker is not None:
+            self.placement_worker.cancel()
+        
+        # Only allow adaptive placements if player has moved significantly from start
+        # and has advanced enough from last placement
+        if new_position > 20 and new_position - self.last_placement_position >= self.placement_threshold:
+            if random.random() < 0.7:  # 70% chance to add new elements
+                if self.placement_worker is not None:
+                    self.placement_worker.submit(self.snapshot())
+                else:
+                    self.add_adaptive_placements()
+                self.last_placement_position = new_position
+    
+    def snapshot(self):
+        """Immutable copy of the state the placement AI works from"""
+        return BoardSnapshot(
+            self.difficulty,
+            tuple(sorted(self.difficulty_settings[self.difficulty].items())),
+            tuple(sorted(self.snakes.items())),
+            tuple(sorted(self.ladders.items())),
+            self.current_position,
+            self.layout_hash
+        )
+    
+    def load_snapshot(self, snapshot):
+        """Reset this board to a snapshot, keeping cached search results that still apply"""
+        settings = dict(snapshot.settings)
+        if snapshot.difficulty != self.difficulty or settings != self.difficulty_settings[snapshot.difficulty]:
+            self.difficulty_settings[snapshot.difficulty] = settings
+            self.configure_difficulty(snapshot.difficulty)
+            
+        self.clear_layout()
+        for start, end in snapshot.ladders:
+            self.add_ladder(start, end)
+        for start, end in snapshot.snakes:
+            self.add_snake(start, end)
+        self.current_position = snapshot.current_position
+    
+    def plan_placements(self, snapshot):
+        """Run adaptive placements from a snapshot and return the snakes and ladders added"""
+        self.load_snapshot(snapshot)
+        self.add_adaptive_placements()
+        
+        old_snakes = dict(snapshot.snakes)
+        old_ladders = dict(snapshot.ladders)
+        new_snakes = tuple((start, end) for start, end in self.snakes.items() if start not in old_snakes)
+        new_ladders = tuple((start, end) for start, end in self.ladders.items() if start not in old_ladders)
+        return new_snakes, new_ladders
+    
+    def apply_placements(self, snapshot, new_snakes, new_ladders):
+        """Apply planned placements unless the board moved on since the snapshot"""
+        if snapshot.layout_hash != self.layout_hash or snapshot.current_position != self.current_position:
+            return False
+            
+        for start, end in new_snakes:
+            if start not in self.snakes and start not in self.ladders:
+                self.add_snake(start, end)
+        for start, end in new_ladders:
+            if start not in self.snakes and start not in self.ladders:
+                self.add_ladder(start, end)
+        return True
+    
+    def apply_pending_placements(self):
+        """Apply the background worker's latest placements, if any are ready"""
+        if self.placement_worker is None:
+            return False
+            
+        result = self.placement_worker.poll()
+        if result is None:
+            return False
+        snapshot, new_snakes, new_ladders, self.last_placement_ms = result
+        return self.apply_placements(snapshot, new_snakes, new_ladders)
+    
+    def search_expired(self):
+        """Whether the running search is past its deadline or was cancelled"""
+        if self.search_deadline is not None and time.perf_counter() > self.search_deadline:
+            return True
+        return self.search_cancel is not None and self.search_cancel.is_set()
+    
+    def get_potential_snake_positions(self, current_pos):
+        """Calculate optimal positions for snake placement using algorithm"""
+        positions = []
+        progress = current_pos / 100
+        
+        # Use Monte Carlo simulation to predict likely positions
+        predictions = self.monte_carlo_simulation(current_pos)
+        if predictions:
+            # Sort positions by probability
+            sorted_positions = sorted(predictions.items(), key=lambda x: x[1], reverse=True)
+            
+            # Take top positions based on progress
+            if progress < 0.3:  # Early game
+                positions = [pos for pos, _ in sorted_positions[:5] if pos < 100]
+            elif progress < 0.7:  # Mid game
+                positions = [pos for pos, _ in sorted_positions[:8] if pos < 100]
+            else:  # Late game
+                positions = [pos for pos, _ in sorted_positions[:10] if pos < 100]
+        
+        # Add positions based on game progress
+        if current_pos < 90:
+            # Add positions that are ahead of the player
+            positions.extend(range(current_pos + 1, min(current_pos + 15, 99)))  # Changed 100 to 99
+        
+        # Remove duplicates and sort
+        return sorted(list(set(positions)))
+
+    def calculate_ladder_placement_score(self, start_pos, end_pos):
+        """Calculate a score for potential ladder placement"""
+        score = 0
+        
+        # Base score on ladder length
+        length = end_pos - start_pos
+        score += length * 2  # Longer ladders get higher scores
+        
+        # Bonus for ladders that help avoid snakes
+        for snake_pos in self.snakes.keys():
+            if start_pos < snake_pos < end_pos:
+                score += 10  # Bonus for ladders that help avoid snakes
+        
+        # Penalty for ladders too close to each other
+        for ladder_start in self.ladders.keys():
+            if abs(ladder_start - start_pos) < 5:
+                score -= 15  # Penalty for ladders too close
+        
+        # Bonus for strategic positions
+        if start_pos <= 30:  # Early game
+            score += 5
+        elif start_pos <= 60:  # Mid game
+            score += 3
+        
+        return score
+
+    def find_optimal_ladder_placement(self):
+        """Find optimal ladder placement using Monte Carlo simulation"""
+        best_score = float('-inf')
+        best_placement = None
+        
+        # Get current player position
+        current_pos = self.current_position
+        
+        # Use Monte Carlo simulation to predict likely positions
+        predictions = self.monte_carlo_simulation(current_pos)
+        
+        # Consider positions based on game progress
+        if current_pos < 30:  # Early game
+            potential_starts = range(2, 31)
+        elif current_pos < 60:  # Mid game
+            potential_starts = range(31, 61)
+        else:  # Late game
+            potential_starts = range(61, 90)
+        
+        # Try multiple placements
+        for start_pos in potential_starts:
+            if start_pos in self.snakes or start_pos in self.ladders:
+                continue
+                
+            # Try different ladder lengths based on difficulty
+            min_length = 5
+            max_length = {
+                "easy": 20,
+                "medium": 15,
+                "hard": 10
+            }[self.difficulty]
+            
+            for length in range(min_length, max_length):
+                end_pos = start_pos + length
+                if end_pos >= 100 or end_pos in self.snakes or end_pos in self.ladders.values():
+                    continue
+                
+                # Calculate score for this placement
+                score = self.calculate_ladder_placement_score(start_pos, end_pos)
+                
+                # Add bonus based on Monte Carlo predictions
+                if predictions and end_pos in predictions:
+                    score += predictions[end_pos] * 20
+                
+                # Bonus for strategic positions
+                if start_pos <= 30:  # Early game
+                    score += 5
+                elif start_pos <= 60:  # Mid game
+                    score += 3
+                
+                # Penalty for ladders too close to each other
+                for ladder_start in self.ladders.keys():
+                    if abs(ladder_start - start_pos) < 5:
+                        score -= 15
+                
+                if score > best_score:
+                    best_score = score
+                    best_placement = (start_pos, end_pos)
+        
+        return best_placement
+
+    def _add_balancing_ladder(self):
+        """Add a ladder to balance the difficulty using the optimal placement algorithm"""
+        # Find optimal ladder placement
+        placement = self.find_optimal_ladder_placement()
+        
+        if placement:
+            start_pos, end_pos = placement
+            
+            # Verify the placement is valid
+            if (start_pos not in self.snakes and 
+                start_pos not in self.ladders and 
+                end_pos not in self.snakes and 
+                end_pos not in self.ladders.values() and
+                not any(abs(pos - start_pos) < 5 for pos in self.ladders.keys())):
+                
+                # Calculate base length
+                base_length = end_pos - start_pos
+                
+                # Get player progress (0 to 1)
+                progress = self.current_position / 100
+                
+                # Adjust length based on difficulty and progress
+                if self.difficulty == "easy":
+                    # In easy mode, longer ladders that get shorter as player progresses
+                    length_multiplier = 1.5 - (progress * 0.5)  # 1.5 to 1.0
+                    max_length = 25 - int(progress * 10)  # 25 to 15 cells
+                elif self.difficulty == "medium":
+                    # In medium mode, balanced ladders that maintain consistent length
+                    length_multiplier = 1.0
+                    max_length = 15
+                else:  # hard mode
+                    # In hard mode, shorter ladders that get even shorter as player progresses
+                    length_multiplier = 0.7 - (progress * 0.2)  # 0.7 to 0.5
+                    max_length = 10 - int(progress * 5)  # 10 to 5 cells
+                
+                # Calculate final length
+                new_length = min(int(base_length * length_multiplier), max_length)
+                final_end_pos = start_pos + new_length
+                
+                # Ensure the ladder is at least 3 cells long and not too steep
+                if final_end_pos - start_pos >= 3:
+                    # Only place the ladder if it climbs at least one row
+                    if self.get_row(final_end_pos) != self.get_row(start_pos):
+                        # Place the ladder
+                        self.add_ladder(start_pos, final_end_pos)
+                        print(f"Added ladder from {start_pos} to {final_end_pos}")
+                        return True
+        
+        return False
+
+    def add_adaptive_placements(self):
+        """Add new snakes and ladders using the difficulty's search algorithm"""
+        start_time = time.perf_counter()
+        settings = self.difficulty_settings[self.difficulty]
+        
+        # Get current player position
+        current_pos = self.current_position
+        
+        # Calculate how close we are to the goal
+        progress = current_pos / 100
+        
+        # Adjust number of snakes based on progress
+        num_snakes_to_place = 1
+        if progress > 0.7:  # After 70% progress
+            num_snakes_to_place = 2
+        if progress > 0.9:  # After 90% progress
+            num_snakes_to_place = 3
+            
+        # Get potential positions from algorithm
+        potential_positions = self.get_potential_snake_positions(current_pos)
+        
+        # Place multiple snakes, sharing the thinking budget between them
+        budget_ms = settings["search_budget_ms"]
+        if budget_ms is not None:
+            budget_ms /= num_snakes_to_place
+            
+        for _ in range(num_snakes_to_place):
+            best_snake_pos = self.find_best_snake_placement(current_pos, potential_positions, budget_ms)
+            
+            # Place the optimal snake if found
+            if best_snake_pos is not None:
+                snake_length = self.get_snake_length(best_snake_pos)
+                self.add_snake(best_snake_pos, max(1, best_snake_pos - snake_length))
+                
+                # Add a balancing ladder if needed (reduced chance in hard mode)
+                ladder_chance = {
+                    "easy": 0.7,    # 70% chance in easy mode
+                    "medium": 0.5,  # 50% chance in medium mode
+                    "hard": 0.3     # 30% chance in hard mode
+                }[self.difficulty]
+                
+                if random.random() < ladder_chance:
+                    self._add_balancing_ladder()
+                    
+        self.last_placement_ms = (time.perf_counter() - start_time) * 1000
+
+    def score_snake_placement(self, current_pos, snake_pos, depth, best_score=float('-inf')):
+        """Search score for placing a snake at snake_pos with the player at current_pos"""
+        settings = self.difficulty_settings[self.difficulty]
+        
+        # Simulate snake placement
+        snake_length = self.get_snake_length(snake_pos)
+        self.add_snake(snake_pos, max(1, snake_pos - snake_length))
+        try:
+            if depth == 0:
+                return self.evaluate_position(current_pos)
+            if settings["search_algorithm"] == "expectimax":
+                # The player rolls next; candidates that cannot beat the best fail low
+                return self.expectimax(current_pos, depth, best_score, float('inf'), False)
+            return self.minimax(current_pos, depth, float('-inf'), float('inf'), True)
+        finally:
+            # Restore original state
+            self.remove_snake(snake_pos)
+    
+    def score_snake_candidates(self, current_pos, candidates, depth):
+        """Search scores for each candidate snake head, None where time ran out"""
+        if self.root_search_workers > 1 and len(candidates) > 1:
+            pool = get_root_search_pool(self.root_search_workers)
+            return self.score_snake_candidates_in_pool(pool, current_pos, candidates, depth)
+                
+        # Scores that cannot beat the best so far may be upper bounds only
+        scores = []
+        best_score = float('-inf')
+        try:
+            for potential_pos in candidates:
+                score = self.score_snake_placement(current_pos, potential_pos, depth, best_score)
+                scores.append(score)
+                best_score = max(best_score, score)
+        except SearchTimeout:
+            scores.extend([None] * (len(candidates) - len(scores)))
+        return scores
+    
+    def score_snake_candidates_in_pool(self, pool, current_pos, candidates, depth):
+        """Score root candidates in parallel on the root search process pool"""
+        import concurrent.futures
+        snapshot = self.snapshot()._replace(current_position=current_pos)
+        # Processes do not share perf_counter, so the deadline travels as wall-clock time
+        deadline = None
+        if self.search_deadline is not None:
+            deadline = time.time() + (self.search_deadline - time.perf_counter())
+            
+        _root_search_cancel.clear()
+        futures = [pool.submit(score_root_candidate, snapshot, potential_pos, depth, deadline)
+                   for potential_pos in candidates]
+        pending = futures
+        while pending:
+            # Wake up now and then to pass a cancelled job on to the pool processes
+            _, pending = concurrent.futures.wait(pending, timeout=0.01)
+            if pending and self.search_cancel is not None and self.search_cancel.is_set():
+                for future in pending:
+                    future.cancel()
+                # Running tasks see the flag at their next node and return None
+                _root_search_cancel.set()
+                concurrent.futures.wait(pending)
+                break
+        return [None if future.cancelled() else future.result() for future in futures]
+    
+    def find_best_snake_placement(self, current_pos, potential_positions, budget_ms=None):
+        """Pick the best snake head, deepening iteratively within budget_ms if given"""
+        max_depth = self.difficulty_settings[self.difficulty]["minimax_depth"]
+            
+        candidates = [pos for pos in potential_positions
+                      if pos not in self.snakes and pos not in self.ladders and pos < 100]
+        if not candidates:
+            return None
+            
+        if budget_ms is None:
+            # Fixed-depth search of every candidate
+            depths = [max_depth]
+        else:
+            # Static scores give a fallback placement and the first move ordering
+            candidates.sort(key=lambda pos: self.score_snake_placement(current_pos, pos, 0), reverse=True)
+            depths = range(1, max_depth + 1)
+            self.search_deadline = time.perf_counter() + budget_ms / 1000
+            
+        # Without a budget there is no fallback: no placement if nothing scores
+        best_snake_pos = None if budget_ms is None else candidates[0]
+        try:
+            for depth in depths:
+                scores = self.score_snake_candidates(current_pos, candidates, depth)
+                
+                # Earliest candidate wins ties, so merged results are deterministic
+                best_score = float('-inf')
+                depth_best_pos = None
+                for potential_pos, score in zip(candidates, scores):
+                    if score is not None and score > best_score:
+                        best_score = score
+                        depth_best_pos = potential_pos
+                        
+                if None in scores:
+                    # Out of time. The previous best is searched first, so a partial
+                    # iteration that re-searched it is at least as informed
+                    if scores[0] is not None and depth_best_pos is not None:
+                        best_snake_pos = depth_best_pos
+                    break
+                    
+                if depth_best_pos is not None:
+                    best_snake_pos = depth_best_pos
+                    # Search the best placement first at the next depth
+                    candidates.remove(best_snake_pos)
+                    candidates.insert(0, best_snake_pos)
+        finally:
+            self.search_deadline = None
+            
+        return best_snake_pos
+
+
+    def get_row(self, position):
+        """Board row of a cell, counted from the bottom"""
+        return (position - 1) // GRID_SIZE
+
+    def remove_random_snake(self):
+        """Remove a random snake from the board"""
+        if self.snakes:
+            snake_head = random.choice(list(self.snakes.keys()))
+            self.remove_snake(snake_head)
+            return True
+        return False
+    
+    def add_power_up(self, position):
+        """Add a random power-up at the given position"""
+        if len(self.power_ups) >= self.max_power_ups:
+            return False
+            
+        if position not in self.snakes and position not in self.ladders:
+            power_up = random.choice(list(POWER_UPS.keys()))
+            self.power_ups[position] = power_up
+            self.gift_boxes.add(position)
+            return True
+        return False
+
+    def get_snake_length(self, position):
+        """Calculate optimal snake length based on position and difficulty"""
+        # Base length starts smaller and increases with position
+        base_length = 5  # Reduced from 10 to start with smaller snakes
+        
+        # Calculate progress (0 to 1)
+        progress = position / 100
+        
+        # Snake length increases with:
+        # 1. Higher difficulty
+        # 2. Closer to goal
+        # 3. Current progress
+        difficulty_multiplier = {
+            "easy": 0.8,
+            "medium": 1.2,
+            "hard": 1.6
+        }[self.difficulty]
+        
+        # Exponential increase in snake length near goal
+        position_multiplier = 1 + (position / 100) ** 2  # Quadratic increase
+        progress_multiplier = 1 + progress * 2  # Doubled progress impact
+        
+        # Calculate final length
+        length = int(base_length * difficulty_multiplier * position_multiplier * progress_multiplier)
+        
+        # Ensure minimum length of 3 and maximum of 30
+        return max(3, min(30, length))
+
+    def snake_evaluation_term(self, snake_start, snake_end):
+        """Score a single snake for the evaluation function"""
+        settings = self.difficulty_settings[self.difficulty]
+        snake_length = snake_start - snake_end
+        
+        # Strategic positioning factors
+        position_factor = 1.0
+        
+        # Snakes near goal are more dangerous
+        if snake_start >= 90:
+            position_factor *= 2.0
+        elif snake_start >= 70:
+            position_factor *= 1.5
+            
+        # Snakes that create "traps" are more effective
+        if snake_start - snake_end > 10:
+            position_factor *= 1.3
+            
+        # Snakes that block common paths are more effective
+        if snake_start % 10 in [5, 6, 7, 8, 9]:
+            position_factor *= 1.2
+            
+        # Add difficulty-based aggression
+        position_factor *= settings["snake_aggression"]
+            
+        return snake_length * position_factor * EVALUATION_DIFFICULTY_FACTORS[self.difficulty]
+    
+    def ladder_evaluation_term(self, ladder_start, ladder_end):
+        """Score a single ladder for the evaluation function, ignoring snakes it bypasses"""
+        settings = self.difficulty_settings[self.difficulty]
+        ladder_length = ladder_end - ladder_start
+        
+        # Strategic positioning factors
+        position_factor = 1.0
+        
+        # Ladders near start are more helpful
+        if ladder_start <= 30:
+            position_factor *= 1.5
+        elif ladder_start <= 50:
+            position_factor *= 1.2
+            
+        # Add difficulty-based adjustment
+        position_factor *= (2 - settings["snake_aggression"])  # Inverse of snake aggression
+            
+        return ladder_length * position_factor * EVALUATION_DIFFICULTY_FACTORS[self.difficulty]
+    
+    def evaluate_position(self, position):
+        """Enhanced evaluation function with difficulty-based scoring"""
+        # Base evaluation based on position
+        evaluation = (100 - position) * 10
+        
+        # Snake and ladder scores are maintained as snakes and ladders are placed,
+        # ladders that bypass snakes already carry LADDER_BYPASS_FACTOR
+        return evaluation - self.snake_score + self.ladder_score
+
+    def minimax(self, position, depth=None, alpha=float('-inf'), beta=float('inf'), is_maximizing=True):
+        """Enhanced minimax algorithm with difficulty-based depth"""
+        if depth is None:
+            depth = self.difficulty_settings[self.difficulty]["minimax_depth"]
+            
+        # Base cases
+        if depth == 0 or position >= 100:
+            return self.evaluate_position(position)
+        if self.search_expired():
+            raise SearchTimeout()
+            
+        # Transposition table lookup for the current layout
+        cache_key = (self.layout_hash, position, depth, is_maximizing)
+        entry = self.probe_transposition(cache_key)
+        if entry is not None:
+            value, flag = entry
+            if flag == TT_EXACT:
+                return value
+            if flag == TT_LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                return value
+        alpha_orig, beta_orig = alpha, beta
+            
+        if is_maximizing:
+            # AI's turn - trying to maximize difficulty
+            max_eval = float('-inf')
+            
+            # Calculate potential snake positions based on player's position
+            potential_positions = self.get_potential_snake_positions(position)
+            
+            for potential_pos in potential_positions:
+                if potential_pos not in self.snakes and potential_pos not in self.ladders and potential_pos < 100:
+                    # Simulate snake placement
+                    snake_length = self.get_snake_length(potential_pos)
+                    self.add_snake(potential_pos, max(1, potential_pos - snake_length))
+                    
+                    # Recursive call with difficulty-based depth
+                    try:
+                        eval = self.minimax(position, depth - 1, alpha, beta, False)
+                    finally:
+                        # Restore original state
+                        self.remove_snake(potential_pos)
+                    max_eval = max(max_eval, eval)
+                    
+                    # Alpha-beta pruning
+                    alpha = max(alpha, eval)
+                    if beta <= alpha:
+                        break
+                        
+            self.store_transposition(cache_key, max_eval, alpha_orig, beta_orig)
+            return max_eval
+        else:
+            # Player's turn - trying to minimize difficulty
+            min_eval = float('inf')
+            
+            # Consider different dice rolls with difficulty-based weights
+            for dice, weight in self.dice_model.outcomes:
+                new_pos = min(position + dice, 100)
+                
+                if new_pos in self.snakes:
+                    new_pos = self.snakes[new_pos]
+                elif new_pos in self.ladders:
+                    new_pos = self.ladders[new_pos]
+                    
+                eval = self.minimax(new_pos, depth - 1, alpha, beta, True)
+                min_eval = min(min_eval, eval * weight)  # Weight the evaluation
+                
+                # Alpha-beta pruning
+                beta = min(beta, eval)
+                if beta <= alpha:
+                    break
+                    
+            self.store_transposition(cache_key, min_eval, alpha_orig, beta_orig)
+            return min_eval
+    
+    def expectimax(self, position, depth=None, alpha=float('-inf'), beta=float('inf'), is_maximizing=True):
+        """Expectimax search with chance nodes weighted by the difficulty's dice weights"""
+        if depth is None:
+            depth = self.difficulty_settings[self.difficulty]["minimax_depth"]
+            
+        if is_maximizing:
+            return self.expectimax_max(position, depth, alpha, beta)
+        return self.expectimax_chance(position, depth, alpha, beta)
+    
+    def placement_candidates(self, position):
+        """Snake placements the AI considers at position, cached per layout"""
+        cache_key = (self.layout_hash, position)
+        candidates = self.candidate_cache.get(cache_key)
+        if candidates is None:
+            candidates = [pos for pos in self.get_potential_snake_positions(position)
+                          if pos not in self.snakes and pos not in self.ladders and pos < 100]
+            if len(self.candidate_cache) >= self.transposition_table_size:
+                self.candidate_cache.clear()
+            self.candidate_cache[cache_key] = candidates
+        return candidates
+    
+    def dice_outcomes(self, position):
+        """(landing cell, probability) for each roll, most likely first"""
+        outcomes = {}
+        for dice, weight in self.dice_model.outcomes:
+            new_pos = min(position + dice, 100)
+            if new_pos in self.snakes:
+                new_pos = self.snakes[new_pos]
+            elif new_pos in self.ladders:
+                new_pos = self.ladders[new_pos]
+            # Rolls that land on the same cell share one chance branch
+            outcomes[new_pos] = outcomes.get(new_pos, 0) + weight
+            
+        return sorted(outcomes.items(), key=lambda outcome: outcome[1], reverse=True)
+    
+    def expectimax_value_bounds(self, depth):
+        """Lower and upper bounds on any evaluation reachable within depth plies"""
+        # Each max node below can add at most one snake, and the longest snake
+        # near the goal on a blocking column scores the most
+        max_snake_term = self.snake_evaluation_term(95, 65)
+        new_snakes = depth // 2
+        
+        # New snakes can only push ladders into their bypass penalty
+        lower = -(self.snake_score + new_snakes * max_snake_term) + self.ladder_score * LADDER_BYPASS_FACTOR
+        upper = 99 * 10 - self.snake_score + self.ladder_score
+        return lower, upper
+    
+    def expectimax_max(self, position, depth, alpha, beta):
+        """AI node: place the snake that maximizes difficulty"""
+        if depth == 0 or position >= 100:
+            return self.evaluate_position(position)
+            
+        if self.search_expired():
+            raise SearchTimeout()
+            
+        candidates = self.placement_candidates(position)
+        if not candidates:
+            # Nowhere to place a snake, the player rolls again
+            return self.expectimax_chance(position, depth - 1, alpha, beta)
+            
+        cache_key = (self.layout_hash, position, depth, "max")
+        entry = self.probe_transposition(cache_key)
+        if entry is not None:
+            value, flag = entry
+            if flag == TT_EXACT:
+                return value
+            if flag == TT_LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                return value
+        alpha_orig, beta_orig = alpha, beta
+        
+        max_eval = float('-inf')
+        for potential_pos in candidates:
+            snake_length = self.get_snake_length(potential_pos)
+            self.add_snake(potential_pos, max(1, potential_pos - snake_length))
+            try:
+                eval = self.expectimax_chance(position, depth - 1, alpha, beta)
+            finally:
+                self.remove_snake(potential_pos)
+            
+            max_eval = max(max_eval, eval)
+            alpha = max(alpha, eval)
+            if beta <= alpha:
+                break
+                
+        self.store_transposition(cache_key, max_eval, alpha_orig, beta_orig)
+        return max_eval
+    
+    def expectimax_probe(self, position, depth, alpha, beta):
+        """Star2 probe: search only the first placement, a lower bound on the AI node"""
+        if depth == 0 or position >= 100:
+            return self.evaluate_position(position)
+            
+        candidates = self.placement_candidates(position)
+        if not candidates:
+            return self.expectimax_chance(position, depth - 1, alpha, beta)
+            
+        first_pos = candidates[0]
+        snake_length = self.get_snake_length(first_pos)
+        self.add_snake(first_pos, max(1, first_pos - snake_length))
+        try:
+            return self.expectimax_chance(position, depth - 1, alpha, beta)
+        finally:
+            self.remove_snake(first_pos)
+    
+    def expectimax_chance(self, position, depth, alpha, beta):
+        """Player node: expected value over dice rolls with Star1/Star2 pruning"""
+        if depth == 0 or position >= 100:
+            return self.evaluate_position(position)
+            
+        cache_key = (self.layout_hash, position, depth, "chance")
+        entry = self.probe_transposition(cache_key)
+        if entry is not None:
+            value, flag = entry
+            if flag == TT_EXACT:
+                return value
+            if flag == TT_LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                return value
+        alpha_orig, beta_orig = alpha, beta
+        
+        lower, upper = self.expectimax_value_bounds(depth)
+        outcomes = self.dice_outcomes(position)
+        
+        # Star2 probing: a lower bound for every roll, cut off if they already reach beta
+        probes = []
+        probed = 0.0
+        remaining = 1.0
+        for new_pos, prob in outcomes:
+            remaining -= prob
+            child_beta = (beta - probed - remaining * lower) / prob
+            probe = self.expectimax_probe(new_pos, depth - 1, lower, min(child_beta, upper))
+            probed += prob * probe
+            if probe >= child_beta:
+                value = probed + max(remaining, 0) * lower
+                self.store_transposition(cache_key, value, alpha_orig, beta_orig)
+                return value
+            probes.append(probe)
+            
+        # Star1 search: full search of each roll, windowed by the bounds of the rest
+        expected = 0.0
+        remaining = 1.0
+        remaining_lower = probed
+        for (new_pos, prob), probe in zip(outcomes, probes):
+            remaining -= prob
+            remaining_lower -= prob * probe
+            child_alpha = (alpha - expected - max(remaining, 0) * upper) / prob
+            child_beta = (beta - expected - remaining_lower) / prob
+            
+            if probe >= child_beta:
+                eval = probe
+            else:
+                eval = self.expectimax_max(new_pos, depth - 1, max(child_alpha, probe), min(child_beta, upper))
+                # The probe already proved the roll is worth at least that much
+                eval = max(eval, probe)
+            expected += prob * eval
+            
+            if eval <= child_alpha:
+                value = expected + max(remaining, 0) * upper
+                self.store_transposition(cache_key, value, alpha_orig, beta_orig)
+                return value
+            if eval >= child_beta:
+                value = expected + remaining_lower
+                self.store_transposition(cache_key, value, alpha_orig, beta_orig)
+                return value
+                
+        self.store_transposition(cache_key, expected, alpha_orig, beta_orig)
+        return expected
+    
+    def probe_transposition(self, key):
+        """Look up a cached search result, marking it recently used"""
+        entry = self.transposition_table.get(key)
+        if entry is not None:
+            self.transposition_table.move_to_end(key)
+        return entry
+    
+    def store_transposition(self, key, value, alpha, beta):
+        """Cache a search result with its bound flag, evicting the least recently used entry"""
+        if value <= alpha:
+            flag = TT_UPPER
+        elif value >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+            
+        self.transposition_table[key] = (value, flag)
+        self.transposition_table.move_to_end(key)
+        if len(self.transposition_table) > self.transposition_table_size:
+            self.transposition_table.popitem(last=False)
+
+_root_search_pool = None  # (workers, ProcessPoolExecutor) shared by every Board
+_root_search_cancel = None  # SharedFlag the pool's searches poll, set to abort them
+_root_search_board = None  # Search board of a root search worker process
+
+class SharedFlag:
+    """Cancel flag shared with pool processes, cheap enough to poll at every search node"""
+    def __init__(self, context):
+        self.value = context.RawValue("b", 0)
+        
+    def is_set(self):
+        return bool(self.value.value)
+        
+    def set(self):
+        self.value.value = 1
+        
+    def clear(self):
+        self.value.value = 0
+
+def get_root_search_pool(workers):
+    """Persistent process pool for root candidate searches"""
+    global _root_search_pool, _root_search_cancel
+    if _root_search_pool is None or _root_search_pool[0] != workers:
+        # Only imported when a pool is actually used, they are slow to load
+        import multiprocessing
+        import concurrent.futures
+        if _root_search_pool is not None:
+            _root_search_pool[1].shutdown(cancel_futures=True)
+            
+        # Fork starts workers fastest, spawned ones re-import __main__, which has no side effects
+        start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        context = multiprocessing.get_context(start_method)
+        _root_search_cancel = SharedFlag(context)
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_root_search_worker,
+            initargs=(_root_search_cancel,)
+        )
+        # Workers launch on the first submit, do it from the caller's thread now
+        pool.submit(int)
+        _root_search_pool = (workers, pool)
+    return _root_search_pool[1]
+
+def _init_root_search_worker(cancel):
+    """Give each forked worker its own random state and search board"""
+    global _root_search_board
+    random.seed()
+    _root_search_board = Board()
+    _root_search_board.root_search_workers = 0
+    _root_search_board.search_cancel = cancel  # Set by the parent to abort a cancelled job
+
+def score_root_candidate(snapshot, snake_pos, depth, deadline):
+    """Pool task: score one root snake placement from a board snapshot"""
+    board = _root_search_board
+    # Reloading keeps the worker's transposition table while the difficulty stays the same
+    board.load_snapshot(snapshot)
+    if deadline is not None:
+        board.search_deadline = time.perf_counter() + (deadline - time.time())
+    try:
+        return board.score_snake_placement(snapshot.current_position, snake_pos, depth)
+    except SearchTimeout:
+        return None
+    finally:
+        board.search_deadline = None
+
+class PlacementWorker:
+    """Computes adaptive placements on a background thread from board snapshots"""
+    # The thread shares the GIL with the render loop, so frames stay on time only while
+    # search_budget_ms bounds each job; a fixed-depth search can stall them for tens of ms
+    def __init__(self, on_result=None):
+        self.search_board = Board()  # Private board whose transposition table persists between jobs
+        self.on_result = on_result  # Called on the worker thread when a result is ready
+        self.jobs = queue.Queue()
+        self.lock = threading.Lock()
+        self.result = None  # (snapshot, new snakes, new ladders, search ms) waiting to be applied
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="placement-worker", daemon=True)
+        self.thread.start()
+        
+    def submit(self, snapshot):
+        """Start planning placements for a snapshot, cancelling any earlier job"""
+        self.cancel()
+        self.cancel_event = threading.Event()
+        self.jobs.put((snapshot, self.cancel_event))
+        
+    def cancel(self):
+        """Abort the running job and drop any result not yet applied"""
+        self.cancel_event.set()
+        with self.lock:
+            self.result = None
+            
+    def poll(self):
+        """Take the finished result, or None if nothing is ready"""
+        with self.lock:
+            result, self.result = self.result, None
+        return result
+        
+    def close(self):
+        """Stop the worker thread"""
+        self.cancel()
+        self.jobs.put(None)
+        
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+                
+            snapshot, cancel_event = job
+            if cancel_event.is_set():
+                continue
+                
+            self.search_board.search_cancel = cancel_event
+            try:
+                new_snakes, new_ladders = self.search_board.plan_placements(snapshot)
+            finally:
+                self.search_board.search_cancel = None
+                
+            with self.lock:
+                if cancel_event.is_set():
+                    continue
+                self.result = (snapshot, new_snakes, new_ladders, self.search_board.last_placement_ms)
+            if self.on_result is not None:
+                self.on_result()
+
+class Dice:
+    def __init__(self):
+        self.value = 1
+        self.rolling = False
+        self.roll_frames = 0
+        self.total_frames = 20
+        
+    def roll(self):
+        self.rolling = True
+        self.roll_frames = 0
+        self.value = random.randint(1, 6)
+        
+    def update(self):
+        if self.rolling:
+            self.roll_frames += 1
+            if self.roll_frames < self.total_frames:
+                # Show random values while rolling
+                self.value = random.randint(1, 6)
+            else:
+                self.rolling = False
+                return True
+        return False
+
+class Game:
+    """Turn resolution and timer for one game, driven by update() or play_turn()"""
+    def __init__(self, clock=time.time):
+        self.clock = clock  # Seconds since the epoch, swap in a simulated clock for headless runs
+        self.board = self.create_board()
+        self.player = self.create_player()
+        self.dice = self.create_dice()
+        self.state = "difficulty"  # difficulty, playing, end
+        self.difficulty = None
+        self.time_left = 0
+        self.start_time = 0
+        self.message = ""
+        self.message_time = 0
+        self.last_dice_value = 0
+        self.previous_position = 1
+        self.power_up_cooldown = 0  # Cooldown for power-up usage
+        self.power_up_cooldown_time = 1000  # 1 second cooldown in milliseconds
+        self.last_time_update = 0  # Track last time update for smooth display
+        self.time_boost = 0  # Track additional time from boosts
+        self.snake_bite = False  # Add flag for snake bite state
+        self.snake_bite_position = None  # Store snake bite position
+        self.snake_bite_target = None  # Store snake bite target position
+        
+        # Animation flags
+        self.animating = False
+        self.animation_done = False
+        
+    def create_board(self):
+        return Board()
+        
+    def create_player(self):
+        return Player("Player")
+        
+    def create_dice(self):
+        return Dice()
+        
+    def ticks(self):
+        """Milliseconds on the game clock"""
+        return int(self.clock() * 1000)
+
+    def set_message(self, text):
+        self.message = text
+        self.message_time = self.ticks()
+
+    def add_time(self, seconds):
+        """Add time to the timer and update display"""
+        self.time_boost += seconds
+        self.time_left += seconds
+        self.set_message(f"Added {seconds} seconds!")
+
+    def start_game(self, difficulty):
+        self.state = "playing"
+        self.difficulty = difficulty
+        self.time_left = DIFFICULTY_TIMES[difficulty]
+        self.start_time = self.clock()
+        self.time_boost = 0  # Reset time boost counter
+        
+        # Configure board based on difficulty
+        self.board.configure_difficulty(difficulty)
+        self.board.initialize_gift_boxes()
+        
+        # Reset player position
+        self.player.position = 1
+        self.player.target_position = 1
+        self.player.is_moving = False
+        self.player.move_progress = 0
+        
+        # Reset animation flags
+        self.animating = False
+        self.animation_done = False
+        
+        # Clear any existing messages
+        self.message = ""
+        self.message_time = 0
+        
+    def update_timer(self):
+        """Refresh time_left and end the game when it runs out, False once time is up"""
+        current_time = self.clock()
+        if current_time - self.last_time_update >= 0.1:
+            base_time = DIFFICULTY_TIMES[self.difficulty] - (current_time - self.start_time)
+            self.time_left = max(0, base_time + self.time_boost)
+            self.last_time_update = current_time
+        
+        if self.time_left <= 0:
+            self.state = "end"
+            self.set_message("Time's up! Game Over!")
+            return False
+        return True
+
+    def update(self):
+        if self.state == "playing":
+            if not self.update_timer():
+                return
+                
+            # Pick up snakes and ladders the AI worker finished placing
+            self.board.apply_pending_placements()
+                
+            if self.animating:
+                # Dice rolling animation
+                if self.dice.update() and not self.animation_done:
+                    self.last_dice_value = self.dice.value
+                    self.previous_position = self.player.position
+                    self.player.move(self.dice.value)
+                    self.animation_done = True
+                    self.set_message(f"You rolled a {self.dice.value}")
+                
+                # Player movement animation
+                if self.animation_done:
+                    if self.player.update_animation():
+                        self.resolve_landing()
+                        
+    def play_turn(self, dice_value=None):
+        """Roll and resolve a whole turn at once, skipping the dice and movement animations"""
+        if self.state != "playing" or not self.update_timer():
+            return
+        self.board.apply_pending_placements()
+        
+        self.dice.value = dice_value if dice_value is not None else random.randint(1, 6)
+        self.last_dice_value = self.dice.value
+        self.previous_position = self.player.position
+        self.player.move(self.dice.value)
+        self.player.finish_move()
+        self.resolve_landing()
+                        
+    def resolve_landing(self):
+        """Apply gifts, snakes, ladders and the win check once the player has finished moving"""
+        position = self.player.position
+        
+        # Check for power-up collection
+        if position in self.board.power_ups:
+            power_up = self.board.power_ups[position]
+            if len(self.player.power_ups) < 3:
+                self.player.add_power_up(power_up)
+                del self.board.power_ups[position]
+                self.board.gift_boxes.remove(position)
+                self.set_message(f"Collected {POWER_UPS[power_up]['name']}!")
+            else:
+                self.set_message("Power-up inventory full!")
+        
+        # Update AI with new player position
+        if position > self.previous_position:
+            self.board.update_player_position(position)
+        
+        # Check for snakes
+        if position in self.board.snakes and not self.snake_bite:
+            if self.player.has_immunity:
+                self.player.has_immunity = False
+                self.set_message("Immunity protected you from the snake!")
+                self.animating = False
+                self.animation_done = False
+            else:
+                self.snake_bite = True
+                self.snake_bite_position = position
+                self.snake_bite_target = self.board.snakes[position]
+                # Directly place player at snake end position
+                self.player.position = self.snake_bite_target
+                self.player.current_display_pos = self.snake_bite_target
+                self.set_message("Oh no! You hit a snake!")
+                self.snake_bite = False
+                self.snake_bite_position = None
+                self.snake_bite_target = None
+                self.animating = False
+                self.animation_done = False
+            return
+            
+        # Check for ladders
+        if position in self.board.ladders:
+            new_pos = self.board.ladders[position]
+            self.player.position = new_pos
+            self.player.current_display_pos = new_pos
+            self.set_message("Yay! You climbed a ladder!")
+            self.animating = False
+            self.animation_done = False
+            return
+            
+        # Check for win
+        if position == 100:
+            self.state = "end"
+            self.set_message("Congratulations! You won!")
+            self.on_win()
+            return
+        
+        self.animating = False
+        self.animation_done = False
+        
+    def on_win(self):
+        """Called once when the player reaches cell 100"""
+        self.player.win = True
+        
+    def use_power_up(self, index):
+        """Use the power-up in inventory slot index unless it is cooling down"""
+        current_time = self.ticks()
+        if current_time - self.power_up_cooldown < self.power_up_cooldown_time:
+            return None
+        power_up = self.player.use_power_up(index)
+        if power_up:
+            self.power_up_cooldown = current_time
+            POWER_UPS[power_up]["effect"](self)
+            self.set_message(f"Used {POWER_UPS[power_up]['name']}!")
+            self.animating = False
+            self.animation_done = False
+        return power_up
+
+    def roll_dice(self):
+        """Handle dice rolling"""
+        if not self.animating:
+            self.dice.roll()
+            self.animating = True
+            self.animation_done = False
+            self.set_message("Rolling...")
+
+    def restart_game(self):
+        """Restart the game"""
+        if self.board.placement_worker is not None:
+            self.board.placement_worker.close()
+        self.__init__(self.clock)
@@ -1,31 +1,45 @@
-import pygame
+import time
+
+STARTUP_START = time.perf_counter()  # Start of the --startup-profile timeline
+STARTUP_BUDGET_MS = 500  # Import to first difficulty screen frame
+startup_timeline = []  # (milestone, ms since STARTUP_START)
+
+def startup_mark(label):
+    """Record a startup milestone for --startup-profile"""
+    startup_timeline.append((label, (time.perf_counter() - STARTUP_START) * 1000))
+
 import sys
 import random
 import math
-import time
-import numpy as np
-from pygame import gfxdraw
-from collections import deque, defaultdict
-
-# Initialize pygame
-pygame.init()
+import pygame
+from collections import OrderedDict
+startup_mark("import pygame")
+import engine
+from engine import GRID_SIZE, DIFFICULTY_TIMES, POWER_UPS, PlacementWorker, get_root_search_pool
+startup_mark("import engine")
 
-# Get screen info for fullscreen
-screen_info = pygame.display.Info()
-SCREEN_WIDTH = screen_info.current_w
-SCREEN_HEIGHT = screen_info.current_h
-BOARD_SIZE = min(SCREEN_HEIGHT - 150, 800)  # Adjusted board size for fullscreen
-GRID_SIZE = 10
-CELL_SIZE = BOARD_SIZE // GRID_SIZE
+# Screen dimensions, set by init_display from the monitor size
+SCREEN_WIDTH = 0
+SCREEN_HEIGHT = 0
+BOARD_SIZE = 0
+CELL_SIZE = 0
 DICE_SIZE = 80  # Adjusted dice size for fullscreen
 ANIMATION_SPEED = 15
 
-# Difficulty settings
-DIFFICULTY_TIMES = {
-    "easy": 120,    # 2 minutes in seconds
-    "medium": 60,  # 1  minutes 20 in seconds
-    "hard": 30,    # 5 minutes in seconds
-}
+# Run adaptive placements on a background thread instead of inside Game.update
+# The thread shares the GIL, so smooth frames need a finite search_budget_ms
+BACKGROUND_AI = True
+
+# Redraw and update only the screen areas that changed, --full-redraw turns it off
+DIRTY_RECTS = True
+
+# Sleep in pygame.event.wait while nothing animates instead of drawing 60 frames a second
+IDLE_PACING = True
+IDLE_WAKE_MS = 1000  # Longest idle sleep
+GIFT_BOX_IDLE_FPS = 15  # Gift box animation rate while waiting for the player
+
+# Posted by the AI worker thread so an idle main loop wakes up for new placements
+PLACEMENT_READY = pygame.event.custom_type()
 
 # Colors - Forest Theme
 # Primary colors
@@ -85,79 +99,298 @@ TREE_COLORS = [
     (205, 133, 63)  # Peru
 ]
 
-# Power-up types and their effects
-POWER_UPS = {
-    "time_boost": {
-        "name": "Time Boost",
-        "description": "Adds 5 seconds to the timer",
-        "color": POWER_UP_COLORS["time_boost"],
-        "effect": lambda game: game.add_time(5)  # Use a method instead of direct attribute change
-    },
-    "snake_killer": {
-        "name": "Snake Killer",
-        "description": "Removes a random snake from the board",
-        "color": POWER_UP_COLORS["snake_killer"],
-        "effect": lambda game: game.board.remove_random_snake()
-    },
-    "immunity": {
-        "name": "Immunity",
-        "description": "Protects from next snake bite",
-        "color": POWER_UP_COLORS["immunity"],
-        "effect": lambda game: setattr(game.player, 'has_immunity', True)
-    }
-}
+# Display, created by init_display
+screen = None
+clock = None
 
-# Create the screen
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-pygame.display.set_caption("Snakes and Ladders")
-clock = pygame.time.Clock()
+def init_display():
+    """Open the fullscreen window, starting only the pygame subsystems the game uses"""
+    global screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT, BOARD_SIZE, CELL_SIZE
+    pygame.display.init()
+    pygame.font.init()
+    
+    # Get screen info for fullscreen
+    screen_info = pygame.display.Info()
+    SCREEN_WIDTH = screen_info.current_w
+    SCREEN_HEIGHT = screen_info.current_h
+    BOARD_SIZE = min(SCREEN_HEIGHT - 150, 800)  # Adjusted board size for fullscreen
+    CELL_SIZE = BOARD_SIZE // GRID_SIZE
+    
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+    pygame.display.set_caption("Snakes and Ladders")
+    clock = pygame.time.Clock()
+    cell_centres[:] = build_cell_centres()
+    startup_mark("open display")
+
+# Screen (x, y) centre of every cell by cell number, index 0 unused, rebuilt by init_display
+cell_centres = []
+
+def build_cell_centres():
+    """Cell centres for the current resolution, numbered along the serpentine path"""
+    board_x = (SCREEN_WIDTH - BOARD_SIZE) // 2
+    board_y = (SCREEN_HEIGHT - BOARD_SIZE) // 2
+    centres = [None]
+    for position in range(GRID_SIZE * GRID_SIZE):
+        row = GRID_SIZE - 1 - position // GRID_SIZE
+        col = position % GRID_SIZE if (GRID_SIZE - 1 - row) % 2 == 0 else GRID_SIZE - 1 - position % GRID_SIZE
+        centres.append((board_x + col * CELL_SIZE + CELL_SIZE // 2,
+                        board_y + row * CELL_SIZE + CELL_SIZE // 2))
+    return centres
+
+class LazyFont:
+    """pygame font that is loaded the first time it is used"""
+    def __init__(self, point_size):
+        self.point_size = point_size
+        self.font = None
+        
+    def __getattr__(self, name):
+        if self.font is None:
+            self.font = pygame.font.Font(None, self.point_size)
+            startup_mark(f"load font {self.point_size}")
+        return getattr(self.font, name)
+
+class SurfaceCache:
+    """Bounded LRU cache of rendered surfaces with hit and miss counters"""
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        
+    def get(self, key, render):
+        """Surface cached under key, calling render() to create it on a miss"""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+            
+        self.misses += 1
+        surface = self.entries[key] = render()
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+# Rendered text shared by every widget, callers must not draw on the returned surfaces
+text_cache = SurfaceCache(512)
+
+def render_text(font, text, color, antialias=True):
+    """font.render through the shared text cache"""
+    return text_cache.get((font, text, color, antialias),
+                          lambda: font.render(text, antialias, color))
+
+class GlyphAtlas:
+    """Pre-rendered glyphs of one font and color for text that changes every second"""
+    def __init__(self, font, color, chars):
+        self.glyphs = {char: font.render(char, True, color) for char in chars}
+        # Advance from each glyph to the next, measured in pairs so kerning is kept
+        self.advances = {(first, second): font.size(first + second)[0] - font.size(second)[0]
+                         for first in chars for second in chars}
+        
+    def blit(self, surface, text, pos):
+        """Draw text glyph by glyph"""
+        x, y = pos
+        for i, char in enumerate(text):
+            surface.blit(self.glyphs[char], (x, y))
+            if i + 1 < len(text):
+                x += self.advances[char, text[i + 1]]
+
+glyph_atlases = {}  # (font, color) -> GlyphAtlas of the digits and ':'
+
+def draw_clock_text(prefix, minutes, seconds, font, color, pos):
+    """Draw prefix followed by MM:SS, with the digits taken from a glyph atlas"""
+    atlas = glyph_atlases.get((font, color))
+    if atlas is None:
+        atlas = glyph_atlases[font, color] = GlyphAtlas(font, color, "0123456789:")
+    prefix_text = render_text(font, prefix, color)
+    screen.blit(prefix_text, pos)
+    atlas.blit(screen, f"{minutes:02d}:{seconds:02d}", (pos[0] + prefix_text.get_width(), pos[1]))
+
+# (top color, bottom color, screen width, screen height) -> full-screen vertical gradient
+gradient_backgrounds = {}
+
+def vertical_gradient(top, bottom):
+    """Screen-sized surface fading from top to bottom, built once per resolution"""
+    key = (top, bottom, SCREEN_WIDTH, SCREEN_HEIGHT)
+    if key not in gradient_backgrounds:
+        import numpy as np
+        # Same per-row colors as drawing one line per row, written in a single array copy
+        progress = np.arange(SCREEN_HEIGHT) / SCREEN_HEIGHT
+        top_color = np.array(top[:3])
+        rows = (top_color + (np.array(bottom[:3]) - top_color) * progress[:, None]).astype(np.uint8)
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        pygame.surfarray.blit_array(surface, np.broadcast_to(rows, (SCREEN_WIDTH, SCREEN_HEIGHT, 3)))
+        gradient_backgrounds[key] = surface
+    return gradient_backgrounds[key]
 
 # Fonts
-title_font = pygame.font.Font(None, 72)  # Reduced font size
-button_font = pygame.font.Font(None, 36)  # Reduced font size
-info_font = pygame.font.Font(None, 28)  # Reduced font size
-cell_font = pygame.font.Font(None, 24)  # Reduced font size
+title_font = LazyFont(72)  # Reduced font size
+button_font = LazyFont(36)  # Reduced font size
+info_font = LazyFont(28)  # Reduced font size
+cell_font = LazyFont(24)  # Reduced font size
+
+class FrameTimers:
+    """Rolling per-phase frame times in milliseconds, only recorded while enabled"""
+    def __init__(self, size=240):
+        self.size = size  # Frames kept in each ring buffer
+        self.enabled = False
+        self.samples = {}  # phase -> ring buffer of ms per frame
+        self.index = 0  # Ring buffer slot of the current frame
+        self.frames = 0
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.samples = {}
+        self.index = 0
+        self.frames = 0
+        
+    def start_frame(self):
+        if not self.enabled:
+            return
+        for buffer in self.samples.values():
+            buffer[self.index] = 0.0
+        self.frame_start = self.last_mark = time.perf_counter()
+        
+    def mark(self, phase):
+        """Charge the time since the previous mark to phase"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        buffer = self.samples.get(phase)
+        if buffer is None:
+            buffer = self.samples[phase] = [0.0] * self.size
+        buffer[self.index] += (now - self.last_mark) * 1000
+        self.last_mark = now
+        
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.last_mark = self.frame_start
+        self.mark("frame")
+        self.index = (self.index + 1) % self.size
+        self.frames += 1
+        
+    def stats(self, phase):
+        """(current, p50, p95, max) ms of a phase over the buffered frames"""
+        buffer = self.samples[phase]
+        count = min(self.frames, self.size)
+        if count == 0:
+            return 0.0, 0.0, 0.0, 0.0
+        values = sorted(buffer[:count])
+        return (buffer[self.index - 1], values[count // 2],
+                values[min(count - 1, int(count * 0.95))], values[-1])
+
+frame_timers = FrameTimers()
+
+class PowerUpPanel:
+    """Panel, slot and use button rects for a number of power-ups, with O(1) hit-testing"""
+    width = 280  # Increased for fullscreen
+    height = 400  # Increased for fullscreen
+    slot_height = 45  # Reduced slot height
+    slot_spacing = 10  # Reduced spacing
+    
+    def __init__(self, count):
+        self.rect = pygame.Rect(SCREEN_WIDTH - 300, 50, self.width, self.height)  # Adjusted for fullscreen
+        self.slot_top = self.rect.y + 60
+        self.slot_pitch = self.slot_height + self.slot_spacing
+        self.slots = [pygame.Rect(self.rect.x + 10, self.slot_top + i * self.slot_pitch,
+                                  self.width - 20, self.slot_height)
+                      for i in range(count)]
+        self.use_buttons = [pygame.Rect(slot.right - 50, slot.centery - 15, 40, 30) for slot in self.slots]
+        
+    def slot_at(self, pos):
+        """Index of the slot under pos, or None"""
+        index = (pos[1] - self.slot_top) // self.slot_pitch
+        if 0 <= index < len(self.slots) and self.slots[index].collidepoint(pos):
+            return index
+        return None
+        
+    def use_button_at(self, pos):
+        """Index of the slot whose use button is under pos, or None"""
+        index = self.slot_at(pos)
+        if index is not None and self.use_buttons[index].collidepoint(pos):
+            return index
+        return None
+        
+    def render_chrome(self):
+        """Panel shadow, background, border and title on a transparent surface"""
+        shadow_offset = 5
+        surface = pygame.Surface((self.width + shadow_offset, self.height + shadow_offset), pygame.SRCALPHA)
+        
+        # Draw panel background with shadow
+        pygame.draw.rect(surface, (*BLACK, 50),
+                        (shadow_offset, shadow_offset, self.width, self.height),
+                        border_radius=10)
+        
+        # Draw main panel with forest theme
+        pygame.draw.rect(surface, BOARD_BG,
+                        (0, 0, self.width, self.height),
+                        border_radius=10)
+        pygame.draw.rect(surface, BOARD_BORDER,
+                        (0, 0, self.width, self.height),
+                        2, border_radius=10)
+        
+        # Draw title with forest theme, opaque as the screen always showed it
+        title_bg = pygame.Rect(5, 5, self.width - 10, 40)
+        pygame.draw.rect(surface, SECONDARY, title_bg, border_radius=8)
+        pygame.draw.rect(surface, BLACK, title_bg, 2, border_radius=8)
+        
+        title_text = render_text(info_font, "Power-ups", TEXT_LIGHT)
+        title_rect = title_text.get_rect(center=title_bg.center)
+        surface.blit(title_text, title_rect)
+        return surface.convert_alpha()
+        
+    def render_slot(self, power_up, is_hovered):
+        """One power-up slot with its use button, on a transparent surface at the slot's top left"""
+        name_text = render_text(info_font, POWER_UPS[power_up]["name"], TEXT_LIGHT)
+        desc_text = render_text(cell_font, POWER_UPS[power_up]["description"], TEXT_LIGHT)
+        
+        # Room for the shadow, and for descriptions longer than the slot
+        slot_rect = pygame.Rect(0, 0, self.width - 20, self.slot_height)
+        surface = pygame.Surface((max(slot_rect.width + 2, 10 + name_text.get_width(), 10 + desc_text.get_width()),
+                                  slot_rect.height + 2), pygame.SRCALPHA)
+        slot_color = POWER_UP_COLORS[power_up] if not is_hovered else tuple(min(c + 30, 255) for c in POWER_UP_COLORS[power_up])
+        
+        # Draw slot with shadow, shadows are opaque as the screen always showed them
+        pygame.draw.rect(surface, BLACK,
+                       (slot_rect.x + 2, slot_rect.y + 2, slot_rect.width, slot_rect.height),
+                       border_radius=8)
+        pygame.draw.rect(surface, slot_color, slot_rect, border_radius=8)
+        pygame.draw.rect(surface, BLACK, slot_rect, 2, border_radius=8)
+        
+        # Draw power-up info
+        surface.blit(name_text, (slot_rect.x + 10, slot_rect.y + 5))
+        surface.blit(desc_text, (slot_rect.x + 10, slot_rect.y + 25))
+        
+        # Draw use button
+        use_btn = pygame.Rect(slot_rect.right - 50, slot_rect.centery - 15, 40, 30)
+        
+        # Button hover effect
+        btn_color = SUCCESS_COLOR if not is_hovered else tuple(min(c + 30, 255) for c in SUCCESS_COLOR)
+        pygame.draw.rect(surface, BLACK,
+                       (use_btn.x + 2, use_btn.y + 2, use_btn.width, use_btn.height),
+                       border_radius=6)
+        pygame.draw.rect(surface, btn_color, use_btn, border_radius=6)
+        pygame.draw.rect(surface, BLACK, use_btn, 2, border_radius=6)
+        
+        use_text = render_text(cell_font, "Use", TEXT_LIGHT)
+        use_rect = use_text.get_rect(center=use_btn.center)
+        surface.blit(use_text, use_rect)
+        return surface.convert_alpha()
 
-class Player:
+# Panel chrome per (screen width, screen height), and (power-up, hovered) -> slot sprite
+power_up_chrome = {}
+power_up_slots = SurfaceCache(64)
+
+class Player(engine.Player):
     def __init__(self, color, name, offset=(0, 0)):
-        self.position = 1
+        super().__init__(name)
         self.color = PLAYER_COLOR
-        self.name = name
         self.offset = offset
-        self.target_position = 1
-        self.is_moving = False
-        self.move_progress = 0
-        self.win = False
-        self.power_ups = []
-        self.has_immunity = False
-        self.max_power_ups = 3
-        self.moving_down = False
-        self.animation_speed = 0.1
-        self.current_display_pos = 1
-        self.animation_start_pos = 1
-        
-    def move(self, steps):
-        self.animation_start_pos = self.position
-        self.target_position = min(self.position + steps, 100)
-        self.is_moving = True
-        self.move_progress = 0
-        self.moving_down = steps < 0
-        self.animation_speed = 0.1
-        
-    def update_animation(self):
-        if self.is_moving:
-            self.move_progress += self.animation_speed
-            self.current_display_pos = self.animation_start_pos + (self.target_position - self.animation_start_pos) * self.move_progress
-            
-            if self.move_progress >= 1:
-                self.position = self.target_position
-                self.current_display_pos = self.target_position
-                self.is_moving = False
-                return True
-        return False
-
-    def get_current_display_position(self):
-        return self.current_display_pos
+        self.power_up_panel = None  # PowerUpPanel laid out for power_up_panel_key
+        self.power_up_panel_key = None  # (inventory, screen size) the panel was laid out for
 
     def draw(self, board):
         pos = self.get_current_display_position()
@@ -175,155 +408,78 @@ class Player:
         # Draw player
         pygame.draw.circle(screen, self.color, (x, y), CELL_SIZE // 4)
         pygame.draw.circle(screen, BLACK, (x, y), CELL_SIZE // 4, 2)
-
-    def add_power_up(self, power_up):
-        if len(self.power_ups) < self.max_power_ups:
-            self.power_ups.append(power_up)
-            return True
-        return False
-        
-    def use_power_up(self, index):
-        if 0 <= index < len(self.power_ups):
-            return self.power_ups.pop(index)
-        return None
         
+    def region(self, board):
+        """Screen rect of the token and its glow, with what is drawn there"""
+        x, y = board.get_coordinates(self.get_current_display_position())
+        x += self.offset[0]
+        y += self.offset[1]
+        rect = pygame.Rect(x - CELL_SIZE//2, y - CELL_SIZE//2, CELL_SIZE, CELL_SIZE)
+        return rect, (x, y, self.has_immunity)
+        
+    def power_up_layout(self):
+        """PowerUpPanel for the current inventory, rebuilt only when it changes"""
+        key = (tuple(self.power_ups), SCREEN_WIDTH, SCREEN_HEIGHT)
+        if self.power_up_panel_key != key:
+            self.power_up_panel = PowerUpPanel(len(self.power_ups))
+            self.power_up_panel_key = key
+        return self.power_up_panel
+        
+    def power_up_region(self):
+        """Screen rect of the power-up panel and its shadow, with what is drawn there"""
+        layout = self.power_up_layout()
+        # Long descriptions run past the panel, so the rect goes on to the screen edge
+        rect = pygame.Rect(layout.rect.x, layout.rect.y, SCREEN_WIDTH - layout.rect.x, layout.rect.height + 5)
+        return rect, (tuple(self.power_ups), layout.slot_at(pygame.mouse.get_pos()))
+
     def draw_power_ups(self):
         """Draw power-up inventory with improved visuals"""
-        panel_x = SCREEN_WIDTH - 300  # Adjusted for fullscreen
-        panel_y = 50
-        panel_width = 280  # Increased for fullscreen
-        panel_height = 400  # Increased for fullscreen
-        shadow_offset = 5
-        
-        # Draw panel background with shadow
-        shadow_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, (*BLACK, 50),
-                        (0, 0, panel_width, panel_height),
-                        border_radius=10)
-        screen.blit(shadow_surface,
-                   (panel_x + shadow_offset, panel_y + shadow_offset))
+        layout = self.power_up_layout()
         
-        # Draw main panel with forest theme
-        pygame.draw.rect(screen, BOARD_BG,
-                        (panel_x, panel_y, panel_width, panel_height),
-                        border_radius=10)
-        pygame.draw.rect(screen, BOARD_BORDER,
-                        (panel_x, panel_y, panel_width, panel_height),
-                        2, border_radius=10)
-        
-        # Draw title with forest theme
-        title_bg = pygame.Rect(panel_x + 5, panel_y + 5, panel_width - 10, 40)
-        pygame.draw.rect(screen, (*SECONDARY, 200), title_bg, border_radius=8)
-        pygame.draw.rect(screen, BLACK, title_bg, 2, border_radius=8)
-        
-        title_text = info_font.render("Power-ups", True, TEXT_LIGHT)
-        title_rect = title_text.get_rect(center=title_bg.center)
-        screen.blit(title_text, title_rect)
-        
-        # Draw power-up slots
-        slot_y = panel_y + 60
-        slot_height = 45  # Reduced slot height
-        slot_spacing = 10  # Reduced spacing
+        # Panel background, border and title never change
+        chrome = power_up_chrome.get((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if chrome is None:
+            chrome = power_up_chrome[SCREEN_WIDTH, SCREEN_HEIGHT] = layout.render_chrome()
+        screen.blit(chrome, layout.rect.topleft)
         
+        # Slots light up under the mouse, both looks of each are cached
+        hovered = layout.slot_at(pygame.mouse.get_pos())
         for i, power_up in enumerate(self.power_ups):
-            # Draw slot background with hover effect
-            mouse_pos = pygame.mouse.get_pos()
-            slot_rect = pygame.Rect(panel_x + 10, slot_y + i * (slot_height + slot_spacing),
-                                  panel_width - 20, slot_height)
-            
-            is_hovered = slot_rect.collidepoint(mouse_pos)
-            slot_color = POWER_UPS[power_up]["color"] if not is_hovered else tuple(min(c + 30, 255) for c in POWER_UPS[power_up]["color"])
-            
-            # Draw slot with shadow
-            pygame.draw.rect(screen, (*BLACK, 50),
-                           (slot_rect.x + 2, slot_rect.y + 2, slot_rect.width, slot_rect.height),
-                           border_radius=8)
-            pygame.draw.rect(screen, slot_color, slot_rect, border_radius=8)
-            pygame.draw.rect(screen, BLACK, slot_rect, 2, border_radius=8)
-            
-            # Draw power-up info
-            name_text = info_font.render(POWER_UPS[power_up]["name"], True, TEXT_LIGHT)
-            desc_text = cell_font.render(POWER_UPS[power_up]["description"], True, TEXT_LIGHT)
-            
-            name_rect = name_text.get_rect(topleft=(slot_rect.x + 10, slot_rect.y + 5))
-            desc_rect = desc_text.get_rect(topleft=(slot_rect.x + 10, slot_rect.y + 25))
-            
-            screen.blit(name_text, name_rect)
-            screen.blit(desc_text, desc_rect)
-            
-            # Draw use button
-            use_btn = pygame.Rect(slot_rect.right - 50, slot_rect.centery - 15, 40, 30)
-            
-            # Button hover effect
-            btn_color = SUCCESS_COLOR if not is_hovered else tuple(min(c + 30, 255) for c in SUCCESS_COLOR)
-            pygame.draw.rect(screen, (*BLACK, 50),
-                           (use_btn.x + 2, use_btn.y + 2, use_btn.width, use_btn.height),
-                           border_radius=6)
-            pygame.draw.rect(screen, btn_color, use_btn, border_radius=6)
-            pygame.draw.rect(screen, BLACK, use_btn, 2, border_radius=6)
-            
-            use_text = cell_font.render("Use", True, TEXT_LIGHT)
-            use_rect = use_text.get_rect(center=use_btn.center)
-            screen.blit(use_text, use_rect)
-            
-            yield use_btn, i
+            sprite = power_up_slots.get((power_up, i == hovered),
+                                        lambda: layout.render_slot(power_up, i == hovered))
+            screen.blit(sprite, layout.slots[i].topleft)
+
+# Pre-rendered board background, cells, numbers and border per (screen width, screen height)
+static_board_layers = {}
+
+# Gift box animation, the bounce and bow swing both repeat every 2000*pi ms
+GIFT_BOX_CYCLE_MS = 2000 * math.pi
+GIFT_BOX_FRAMES = 240
 
-class Board:
+# Cell size -> GIFT_BOX_FRAMES (gift box sprite, half width) pairs, filled in as the frames are shown
+gift_box_atlases = {}
+
+def gift_box_frame():
+    """Gift box animation frame for the current tick"""
+    cycle_time = pygame.time.get_ticks() % GIFT_BOX_CYCLE_MS
+    return int(cycle_time / GIFT_BOX_CYCLE_MS * GIFT_BOX_FRAMES)
+
+def gift_box_pad():
+    """Half width of a gift box sprite, room for the shadow, bow and sparkles around the centre"""
+    return int(CELL_SIZE // 2.5) + 8
+
+# (x1, y1, x2, y2) screen endpoints -> (snake sprite, offset of its top left from the head)
+snake_sprites = SurfaceCache(256)
+
+# (x1, y1, x2, y2, screen width, screen height) -> (rotated ladder sprite, clamped blit position)
+ladder_sprites = SurfaceCache(256)
+
+class Board(engine.Board):
     def __init__(self):
-        # Start with empty snakes and ladders
-        self.snakes = {}
-        self.ladders = {}
-        self.power_ups = {}  # Dictionary mapping positions to power-up types
-        self.gift_boxes = set()  # Set of positions with gift boxes
-        self.max_power_ups = 5  # Maximum number of power-ups per game
-        
-        # AI adaptive placement system
-        self.roll_history = []  # Store all rolls
-        self.current_position = 1
-        self.ai_enabled = True
-        self.last_placement_position = 1
-        self.placement_threshold = 8  # Reduced: Player must advance this far for new placements
-        self.max_elements = 20  # Maximum combined snakes and ladders
-        self.last_prediction_time = 0
-        self.prediction_interval = 2000  # ms between predictions
-        self.difficulty = "easy"  # Default difficulty
-        
-        # Enhanced difficulty settings
-        self.difficulty_settings = {
-            "easy": {
-                "early_snake_ratio": 0.4,    # 40% snakes in early game
-                "mid_snake_ratio": 0.6,      # 60% snakes in mid game
-                "late_snake_ratio": 0.7,     # 70% snakes in late game
-                "snake_length_factor": 1.0,   # Base snake length multiplier
-                "ladder_length_factor": 1.0,  # Base ladder length multiplier
-                "minimax_depth": 2,          # Shallow search for easy mode
-                "monte_carlo_sims": 500,     # Fewer simulations for easy mode
-                "placement_threshold": 10,    # More frequent placements
-                "snake_aggression": 0.5      # Lower snake aggression
-            },
-            "medium": {
-                "early_snake_ratio": 0.6,    # 60% snakes in early game
-                "mid_snake_ratio": 0.7,      # 70% snakes in mid game
-                "late_snake_ratio": 0.85,    # 85% snakes in late game
-                "snake_length_factor": 1.3,   # 30% longer snakes
-                "ladder_length_factor": 0.8,  # 20% shorter ladders
-                "minimax_depth": 3,          # Medium search depth
-                "monte_carlo_sims": 1000,    # More simulations
-                "placement_threshold": 8,     # Balanced placement frequency
-                "snake_aggression": 0.7      # Medium snake aggression
-            },
-            "hard": {
-                "early_snake_ratio": 0.7,    # 70% snakes in early game
-                "mid_snake_ratio": 0.85,     # 85% snakes in mid game
-                "late_snake_ratio": 0.95,    # 95% snakes in late game
-                "snake_length_factor": 1.6,   # 60% longer snakes
-                "ladder_length_factor": 0.6,  # 40% shorter ladders
-                "minimax_depth": 4,          # Deeper search for hard mode
-                "monte_carlo_sims": 2000,    # More simulations for better prediction
-                "placement_threshold": 6,     # More frequent placements
-                "snake_aggression": 0.9      # High snake aggression
-            }
-        }
+        super().__init__()
+        self.layout_layer = None  # Snakes and ladders pre-rendered over a transparent screen
+        self.layout_layer_rect = None  # Part of layout_layer that has something drawn on it
+        self.layout_layer_key = None  # (layout hash, screen size) layout_layer was drawn for
         
         # Generate gradient for board cells
         self.cell_colors = []
@@ -338,391 +494,32 @@ class Board:
                 row.append(color)
             self.cell_colors.append(row)
         
-        self.initialize_gift_boxes()
-        
-        # Minimax parameters
-        self.max_depth = 3  # How far ahead to look
-        self.evaluation_cache = {}  # Cache for evaluation results
-    
-    def initialize_gift_boxes(self):
-        """Place initial gift boxes in random cells"""
-        available_cells = set(range(2, 99)) - set(self.snakes.keys()) - set(self.ladders.keys())
-        num_initial_gifts = min(5, len(available_cells))  # Start with 5 gift boxes
-        
-        # Clear existing power-ups
-        self.power_ups.clear()
-        self.gift_boxes.clear()
-        
-        # Place new power-ups
-        for cell in random.sample(list(available_cells), num_initial_gifts):
-            self.add_power_up(cell)
-        # Ladders will be placed dynamically through add_adaptive_placements
-    
-    def configure_difficulty(self, difficulty):
-        """Configure board settings based on difficulty"""
-        self.difficulty = difficulty
-        # Clear any existing elements
-        self.snakes = {}
-        self.ladders = {}
-        
-    def get_current_snake_ratio(self):
-        """Get target snake ratio based on difficulty and player progress"""
-        settings = self.difficulty_settings[self.difficulty]
-        
-        # Determine ratio based on progress
-        if self.current_position < 30:
-            return settings["early_snake_ratio"]
-        elif self.current_position < 70:
-            return settings["mid_snake_ratio"]
-        else:
-            return settings["late_snake_ratio"]
-            
-    def get_element_length_factors(self):
-        """Get length factors for snakes and ladders based on difficulty and progress"""
-        settings = self.difficulty_settings[self.difficulty]
-        progress = self.current_position / 100
-        
-        # Base factors from difficulty
-        snake_factor = settings["snake_length_factor"]
-        ladder_factor = settings["ladder_length_factor"]
-        
-        # Modify factors based on progress (0-100%)
-        # Snakes get longer as player advances
-        progress_snake_boost = 1.0 + (progress * 1.0)  # 1.0-2.0x multiplier
-        # Ladders get shorter as player advances
-        progress_ladder_reduction = 1.0 - (progress * 0.5)  # 1.0-0.5x multiplier
-        
-        return snake_factor * progress_snake_boost, ladder_factor * progress_ladder_reduction
-    
-    def monte_carlo_simulation(self, current_position, num_simulations=None, num_steps=3):
-        """Enhanced Monte Carlo simulation with difficulty-based parameters"""
-        if num_simulations is None:
-            num_simulations = self.difficulty_settings[self.difficulty]["monte_carlo_sims"]
-            
-        cell_counts = defaultdict(int)
-        settings = self.difficulty_settings[self.difficulty]
-        
-        for _ in range(num_simulations):
-            pos = current_position
-            steps_taken = 0
-            
-            while steps_taken < num_steps and pos < 100:
-                # Simulate dice roll with weighted probabilities based on difficulty
-                if self.difficulty == "hard":
-                    # In hard mode, favor lower numbers
-                    dice = random.choices(range(1, 7), weights=[0.3, 0.25, 0.2, 0.15, 0.07, 0.03])[0]
-                elif self.difficulty == "medium":
-                    # In medium mode, balanced distribution
-                    dice = random.randint(1, 6)
-                else:
-                    # In easy mode, favor higher numbers
-                    dice = random.choices(range(1, 7), weights=[0.03, 0.07, 0.15, 0.2, 0.25, 0.3])[0]
-                
-                pos += dice
-                steps_taken += 1
-                
-                # Apply existing snakes and ladders
-                if pos in self.snakes:
-                    pos = self.snakes[pos]
-                elif pos in self.ladders:
-                    pos = self.ladders[pos]
-                
-                if pos > 100:
-                    break
-                    
-                # Only count final positions for placement decisions
-                if steps_taken == num_steps:
-                    cell_counts[pos] += 1
-
-        # Convert counts to probabilities with difficulty-based weighting
-        total_hits = sum(cell_counts.values())
-        if total_hits == 0:
-            return {}
-            
-        # Apply difficulty-based weighting to probabilities
-        weighted_probabilities = {}
-        for cell, count in cell_counts.items():
-            base_prob = count / total_hits
-            # Adjust probability based on difficulty and position
-            if self.difficulty == "hard":
-                # In hard mode, increase probability for positions near snakes
-                if any(abs(cell - snake_pos) < 5 for snake_pos in self.snakes.keys()):
-                    base_prob *= 1.5
-            elif self.difficulty == "easy":
-                # In easy mode, increase probability for positions near ladders
-                if any(abs(cell - ladder_pos) < 5 for ladder_pos in self.ladders.keys()):
-                    base_prob *= 1.5
-                    
-            weighted_probabilities[cell] = base_prob
-            
-        return weighted_probabilities
-    
-    def update_player_position(self, new_position):
-        """Update the player's current position for the AI"""
-        self.current_position = new_position
-        
-        # Only allow adaptive placements if player has moved significantly from start
-        # and has advanced enough from last placement
-        if new_position > 20 and new_position - self.last_placement_position >= self.placement_threshold:
-            if random.random() < 0.7:  # 70% chance to add new elements
-                self.add_adaptive_placements()
-                self.last_placement_position = new_position
-    
-    def get_potential_snake_positions(self, current_pos):
-        """Calculate optimal positions for snake placement using algorithm"""
-        positions = []
-        progress = current_pos / 100
-        
-        # Use Monte Carlo simulation to predict likely positions
-        predictions = self.monte_carlo_simulation(current_pos)
-        if predictions:
-            # Sort positions by probability
-            sorted_positions = sorted(predictions.items(), key=lambda x: x[1], reverse=True)
-            
-            # Take top positions based on progress
-            if progress < 0.3:  # Early game
-                positions = [pos for pos, _ in sorted_positions[:5] if pos < 100]
-            elif progress < 0.7:  # Mid game
-                positions = [pos for pos, _ in sorted_positions[:8] if pos < 100]
-            else:  # Late game
-                positions = [pos for pos, _ in sorted_positions[:10] if pos < 100]
-        
-        # Add positions based on game progress
-        if current_pos < 90:
-            # Add positions that are ahead of the player
-            positions.extend(range(current_pos + 1, min(current_pos + 15, 99)))  # Changed 100 to 99
-        
-        # Remove duplicates and sort
-        return sorted(list(set(positions)))
-
-    def calculate_ladder_placement_score(self, start_pos, end_pos):
-        """Calculate a score for potential ladder placement"""
-        score = 0
-        
-        # Base score on ladder length
-        length = end_pos - start_pos
-        score += length * 2  # Longer ladders get higher scores
-        
-        # Bonus for ladders that help avoid snakes
-        for snake_pos in self.snakes.keys():
-            if start_pos < snake_pos < end_pos:
-                score += 10  # Bonus for ladders that help avoid snakes
-        
-        # Penalty for ladders too close to each other
-        for ladder_start in self.ladders.keys():
-            if abs(ladder_start - start_pos) < 5:
-                score -= 15  # Penalty for ladders too close
-        
-        # Bonus for strategic positions
-        if start_pos <= 30:  # Early game
-            score += 5
-        elif start_pos <= 60:  # Mid game
-            score += 3
-        
-        return score
-
-    def find_optimal_ladder_placement(self):
-        """Find optimal ladder placement using Monte Carlo simulation"""
-        best_score = float('-inf')
-        best_placement = None
-        
-        # Get current player position
-        current_pos = self.current_position
-        
-        # Use Monte Carlo simulation to predict likely positions
-        predictions = self.monte_carlo_simulation(current_pos)
-        
-        # Consider positions based on game progress
-        if current_pos < 30:  # Early game
-            potential_starts = range(2, 31)
-        elif current_pos < 60:  # Mid game
-            potential_starts = range(31, 61)
-        else:  # Late game
-            potential_starts = range(61, 90)
-        
-        # Try multiple placements
-        for start_pos in potential_starts:
-            if start_pos in self.snakes or start_pos in self.ladders:
-                continue
-                
-            # Try different ladder lengths based on difficulty
-            min_length = 5
-            max_length = {
-                "easy": 20,
-                "medium": 15,
-                "hard": 10
-            }[self.difficulty]
-            
-            for length in range(min_length, max_length):
-                end_pos = start_pos + length
-                if end_pos >= 100 or end_pos in self.snakes or end_pos in self.ladders.values():
-                    continue
-                
-                # Calculate score for this placement
-                score = self.calculate_ladder_placement_score(start_pos, end_pos)
-                
-                # Add bonus based on Monte Carlo predictions
-                if predictions and end_pos in predictions:
-                    score += predictions[end_pos] * 20
-                
-                # Bonus for strategic positions
-                if start_pos <= 30:  # Early game
-                    score += 5
-                elif start_pos <= 60:  # Mid game
-                    score += 3
-                
-                # Penalty for ladders too close to each other
-                for ladder_start in self.ladders.keys():
-                    if abs(ladder_start - start_pos) < 5:
-                        score -= 15
-                
-                if score > best_score:
-                    best_score = score
-                    best_placement = (start_pos, end_pos)
-        
-        return best_placement
-
-    def _add_balancing_ladder(self):
-        """Add a ladder to balance the difficulty using the optimal placement algorithm"""
-        # Find optimal ladder placement
-        placement = self.find_optimal_ladder_placement()
-        
-        if placement:
-            start_pos, end_pos = placement
-            
-            # Verify the placement is valid
-            if (start_pos not in self.snakes and 
-                start_pos not in self.ladders and 
-                end_pos not in self.snakes and 
-                end_pos not in self.ladders.values() and
-                not any(abs(pos - start_pos) < 5 for pos in self.ladders.keys())):
-                
-                # Calculate base length
-                base_length = end_pos - start_pos
-                
-                # Get player progress (0 to 1)
-                progress = self.current_position / 100
-                
-                # Adjust length based on difficulty and progress
-                if self.difficulty == "easy":
-                    # In easy mode, longer ladders that get shorter as player progresses
-                    length_multiplier = 1.5 - (progress * 0.5)  # 1.5 to 1.0
-                    max_length = 25 - int(progress * 10)  # 25 to 15 cells
-                elif self.difficulty == "medium":
-                    # In medium mode, balanced ladders that maintain consistent length
-                    length_multiplier = 1.0
-                    max_length = 15
-                else:  # hard mode
-                    # In hard mode, shorter ladders that get even shorter as player progresses
-                    length_multiplier = 0.7 - (progress * 0.2)  # 0.7 to 0.5
-                    max_length = 10 - int(progress * 5)  # 10 to 5 cells
-                
-                # Calculate final length
-                new_length = min(int(base_length * length_multiplier), max_length)
-                final_end_pos = start_pos + new_length
-                
-                # Ensure the ladder is at least 3 cells long and not too steep
-                if final_end_pos - start_pos >= 3:
-                    # Calculate the vertical distance between start and end
-                    start_x, start_y = self.get_coordinates(start_pos)
-                    end_x, end_y = self.get_coordinates(final_end_pos)
-                    vertical_distance = abs(end_y - start_y)
-                    
-                    # Only place the ladder if it's not too steep
-                    if vertical_distance >= CELL_SIZE:
-                        # Place the ladder
-                        self.ladders[start_pos] = final_end_pos
-                        print(f"Added ladder from {start_pos} to {final_end_pos}")
-                        return True
-        
-        return False
-
-    def add_adaptive_placements(self):
-        """Add new snakes and ladders using minimax algorithm"""
-        # Clear evaluation cache for new calculations
-        self.evaluation_cache.clear()
-        
-        # Get current player position
-        current_pos = self.current_position
-        
-        # Calculate how close we are to the goal
-        progress = current_pos / 100
-        
-        # Adjust number of snakes based on progress
-        num_snakes_to_place = 1
-        if progress > 0.7:  # After 70% progress
-            num_snakes_to_place = 2
-        if progress > 0.9:  # After 90% progress
-            num_snakes_to_place = 3
-            
-        # Get potential positions from algorithm
-        potential_positions = self.get_potential_snake_positions(current_pos)
-        
-        # Place multiple snakes
-        for _ in range(num_snakes_to_place):
-            best_score = float('-inf')
-            best_snake_pos = None
-            
-            # Consider positions from algorithm
-            for potential_pos in potential_positions:
-                if potential_pos not in self.snakes and potential_pos not in self.ladders and potential_pos < 100:
-                    # Simulate snake placement
-                    original_snakes = self.snakes.copy()
-                    snake_length = self.get_snake_length(potential_pos)
-                    self.snakes[potential_pos] = max(1, potential_pos - snake_length)
-                    
-                    # Evaluate this placement
-                    score = self.minimax(current_pos, self.max_depth, float('-inf'), float('inf'), True)
-                    
-                    # Restore original state
-                    self.snakes = original_snakes
-                    
-                    # Update best placement
-                    if score > best_score:
-                        best_score = score
-                        best_snake_pos = potential_pos
-            
-            # Place the optimal snake if found
-            if best_snake_pos is not None:
-                snake_length = self.get_snake_length(best_snake_pos)
-                self.snakes[best_snake_pos] = max(1, best_snake_pos - snake_length)
-                
-                # Add a balancing ladder if needed (reduced chance in hard mode)
-                ladder_chance = {
-                    "easy": 0.7,    # 70% chance in easy mode
-                    "medium": 0.5,  # 50% chance in medium mode
-                    "hard": 0.3     # 30% chance in hard mode
-                }[self.difficulty]
-                
-                if random.random() < ladder_chance:
-                    self._add_balancing_ladder()
-
     def get_coordinates(self, position):
         # Convert the position (1-100) to (x, y) coordinates
-        position -= 1  # Convert to 0-99
-        row = GRID_SIZE - 1 - position // GRID_SIZE
-        col = position % GRID_SIZE if (GRID_SIZE - 1 - row) % 2 == 0 else GRID_SIZE - 1 - position % GRID_SIZE
-        
-        # Add board offset
-        board_x = (SCREEN_WIDTH - BOARD_SIZE) // 2
-        board_y = (SCREEN_HEIGHT - BOARD_SIZE) // 2
-        
-        x = board_x + col * CELL_SIZE + CELL_SIZE // 2
-        y = board_y + row * CELL_SIZE + CELL_SIZE // 2
-        
-        return x, y
+        cell = int(position)
+        fraction = position - cell
+        if not fraction:
+            return cell_centres[cell]
+            
+        # Moving tokens sit part way along the path to the next cell, round row ends too
+        x1, y1 = cell_centres[cell]
+        x2, y2 = cell_centres[cell + 1]
+        return x1 + (x2 - x1) * fraction, y1 + (y2 - y1) * fraction
         
-    def draw_cell(self, x, y, cell_num, i, j):
+    def draw_cell(self, x, y, cell_num, i, j, surface=None):
         """Draw a single cell with improved visuals"""
-        # Alternating cell colors
-        color = self.cell_colors[i][j]
+        if surface is None:
+            surface = screen
+            
+        # Alternating cell colors, opaque like on the display surface
+        color = self.cell_colors[i][j][:3]
         
         # Draw cell background with gradient effect
         rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
-        pygame.draw.rect(screen, color, rect)
+        pygame.draw.rect(surface, color, rect)
         
         # Draw subtle grid pattern
-        pygame.draw.rect(screen, GRID_LINE_COLOR, rect, 1)
+        pygame.draw.rect(surface, GRID_LINE_COLOR[:3], rect, 1)
         
         # Draw cell number with shadow
         text_color = (50, 50, 50)  # Dark gray for better readability
@@ -734,15 +531,35 @@ class Board:
         # Draw number shadow
         shadow_text = cell_font.render(str(cell_num), True, (0, 0, 0, 100))
         shadow_rect = shadow_text.get_rect(bottomright=(num_rect.right + shadow_offset, num_rect.bottom + shadow_offset))
-        screen.blit(shadow_text, shadow_rect)
-        screen.blit(num_text, num_rect)
+        surface.blit(shadow_text, shadow_rect)
+        surface.blit(num_text, num_rect)
     
     def draw_gift_box(self, x, y):
         """Draw an improved gift box with animation"""
-        current_time = pygame.time.get_ticks()
-        bounce_offset = math.sin(current_time / 500) * 3  # Gentle bouncing animation
+        # The animation repeats every bow swing, so each frame of it is rendered once per cell size
+        atlas = gift_box_atlases.setdefault(CELL_SIZE, [None] * GIFT_BOX_FRAMES)
+        frame = gift_box_frame()
+        if atlas[frame] is None:
+            atlas[frame] = self.render_gift_box_frame(frame * GIFT_BOX_CYCLE_MS / GIFT_BOX_FRAMES)
+        sprite, pad = atlas[frame]
+        screen.blit(sprite, (x - pad, y - pad))
+        
+    def gift_box_regions(self):
+        """(position, (screen rect, animation frame)) for every gift box"""
+        pad = gift_box_pad()
+        frame = gift_box_frame()
+        for position in self.gift_boxes:
+            x, y = self.get_coordinates(position)
+            yield position, (pygame.Rect(x - pad, y - pad, pad * 2, pad * 2), frame)
         
+    def render_gift_box_frame(self, current_time):
+        """Gift box as drawn at current_time, centred on a transparent sprite, with its half width"""
         size = CELL_SIZE // 2.5
+        pad = gift_box_pad()
+        surface = pygame.Surface((pad * 2, pad * 2), pygame.SRCALPHA)
+        x = y = pad
+        
+        bounce_offset = math.sin(current_time / 500) * 3  # Gentle bouncing animation
         y = y + bounce_offset  # Apply bounce effect
         
         # Draw gift box shadow
@@ -750,7 +567,7 @@ class Board:
         shadow_surface = pygame.Surface((int(shadow_size), int(shadow_size)), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surface, (0, 0, 0, 50), 
                         (0, 0, shadow_size, shadow_size), border_radius=5)
-        screen.blit(shadow_surface, 
+        surface.blit(shadow_surface, 
                    (x - shadow_size//2, y - shadow_size//2 + 5))
         
         # Draw main box with gradient effect
@@ -767,19 +584,19 @@ class Board:
         
         # Apply box surface
         box_rect = box_surface.get_rect(center=(x, y))
-        screen.blit(box_surface, box_rect)
+        surface.blit(box_surface, box_rect)
         
         # Draw ribbon
         ribbon_width = size // 4
         ribbon_color = (220, 20, 60)  # Bright red
         
         # Vertical ribbon
-        pygame.draw.rect(screen, ribbon_color,
+        pygame.draw.rect(surface, ribbon_color,
                         (x - ribbon_width//2, y - size//2, ribbon_width, size),
                         border_radius=2)
         
         # Horizontal ribbon
-        pygame.draw.rect(screen, ribbon_color,
+        pygame.draw.rect(surface, ribbon_color,
                         (x - size//2, y - ribbon_width//2, size, ribbon_width),
                         border_radius=2)
         
@@ -794,75 +611,106 @@ class Board:
             pygame.draw.ellipse(bow_surface, bow_color,
                               (0, 0, bow_size, bow_size))
             rotated = pygame.transform.rotate(bow_surface, 45 * direction + math.degrees(angle))
-            screen.blit(rotated,
+            surface.blit(rotated,
                        (x - rotated.get_width()//2 + direction * bow_size//2,
                         y - rotated.get_height()//2))
         
-        # Add sparkle effect
+        # Add sparkle effect, opaque since the screen never blended the twinkle alpha
         sparkle_points = [(size//2, -size//2), (-size//2, size//2),
                          (size//2, size//2), (-size//2, -size//2)]
         sparkle_size = size // 8
-        sparkle_alpha = int(abs(math.sin(current_time / 200)) * 255)  # Twinkling effect
-        sparkle_color = (255, 255, 200, sparkle_alpha)
+        sparkle_color = (255, 255, 200)
         
         for px, py in sparkle_points:
-            pygame.draw.circle(screen, sparkle_color,
+            pygame.draw.circle(surface, sparkle_color,
                              (int(x + px), int(y + py)), sparkle_size)
+        return surface.convert_alpha(), pad
     
-    def draw(self):
-        # Calculate board position for centering
-        board_x = (SCREEN_WIDTH - BOARD_SIZE) // 2
-        board_y = (SCREEN_HEIGHT - BOARD_SIZE) // 2
+    def render_static_layer(self):
+        """Board shadow, background, cells, numbers and border on one transparent surface"""
+        shadow_offset = 15
+        layer = pygame.Surface((BOARD_SIZE + shadow_offset, BOARD_SIZE + shadow_offset), pygame.SRCALPHA)
         
         # Draw board background with shadow
-        shadow_offset = 15
-        shadow_surface = pygame.Surface((BOARD_SIZE, BOARD_SIZE), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, (0, 0, 0, 50),
-                        (0, 0, BOARD_SIZE, BOARD_SIZE),
+        pygame.draw.rect(layer, (0, 0, 0, 50),
+                        (shadow_offset, shadow_offset, BOARD_SIZE, BOARD_SIZE),
                         border_radius=15)
-        screen.blit(shadow_surface,
-                   (board_x + shadow_offset, board_y + shadow_offset))
         
         # Draw main board background
-        pygame.draw.rect(screen, BOARD_BG,
-                        (board_x, board_y, BOARD_SIZE, BOARD_SIZE),
+        pygame.draw.rect(layer, BOARD_BG,
+                        (0, 0, BOARD_SIZE, BOARD_SIZE),
                         border_radius=10)
         
         # Draw cells
         for i in range(GRID_SIZE):
             for j in range(GRID_SIZE):
-                cell_x = board_x + j * CELL_SIZE
-                cell_y = board_y + i * CELL_SIZE
-                
                 # Determine cell number
                 row = GRID_SIZE - 1 - i
                 col = j if row % 2 == 0 else GRID_SIZE - 1 - j
                 cell_num = row * GRID_SIZE + col + 1
                 
-                self.draw_cell(cell_x, cell_y, cell_num, i, j)
+                self.draw_cell(j * CELL_SIZE, i * CELL_SIZE, cell_num, i, j, layer)
         
         # Draw board border
-        pygame.draw.rect(screen, BOARD_BORDER,
-                        (board_x, board_y, BOARD_SIZE, BOARD_SIZE),
+        pygame.draw.rect(layer, BOARD_BORDER,
+                        (0, 0, BOARD_SIZE, BOARD_SIZE),
                         5, border_radius=10)
+        return layer.convert_alpha()
         
-        # Draw gift boxes
-        for position in self.gift_boxes:
-            x, y = self.get_coordinates(position)
-            self.draw_gift_box(x, y)
-        
-        # Draw snakes and ladders
+    def render_layout_layer(self):
+        """Snakes and ladders on a transparent screen-sized surface, with the area they cover"""
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        drawn = []  # Rects touched by each snake and ladder
         for start, end in self.snakes.items():
             start_x, start_y = self.get_coordinates(start)
             end_x, end_y = self.get_coordinates(end)
-            self.draw_snake(start_x, start_y, end_x, end_y)
+            drawn.append(self.draw_snake(start_x, start_y, end_x, end_y, layer))
         
         for start, end in self.ladders.items():
             start_x, start_y = self.get_coordinates(start)
             end_x, end_y = self.get_coordinates(end)
-            self.draw_ladder(start_x, start_y, end_x, end_y)
+            drawn.append(self.draw_ladder(start_x, start_y, end_x, end_y, layer))
+            
+        if not drawn:
+            return layer, pygame.Rect(0, 0, 0, 0)
+        return layer, drawn[0].unionall(drawn[1:]).clip(layer.get_rect())
+    
+    def draw(self):
+        # Calculate board position for centering
+        board_x = (SCREEN_WIDTH - BOARD_SIZE) // 2
+        board_y = (SCREEN_HEIGHT - BOARD_SIZE) // 2
+        
+        # The grid never changes, so it is rendered once per resolution
+        static_key = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        static_layer = static_board_layers.get(static_key)
+        if static_layer is None:
+            static_layer = static_board_layers[static_key] = self.render_static_layer()
+        screen.blit(static_layer, (board_x, board_y))
+        
+        # Draw gift boxes
+        for position in self.gift_boxes:
+            x, y = self.get_coordinates(position)
+            self.draw_gift_box(x, y)
+        
+        # Draw snakes and ladders, re-rendered only when the layout changes
+        layout_key = (self.layout_hash, SCREEN_WIDTH, SCREEN_HEIGHT)
+        if self.layout_layer_key != layout_key:
+            self.layout_layer, self.layout_layer_rect = self.render_layout_layer()
+            self.layout_layer_key = layout_key
+        if self.layout_layer_rect.width:
+            screen.blit(self.layout_layer, self.layout_layer_rect, self.layout_layer_rect)
 
-    def draw_snake(self, x1, y1, x2, y2):
+    def draw_snake(self, x1, y1, x2, y2, surface=None):
+        if surface is None:
+            surface = screen
+            
+        # The curve only depends on the endpoints, so each snake is rendered once
+        sprite, (offset_x, offset_y) = snake_sprites.get(
+            (x1, y1, x2, y2), lambda: self.render_snake_sprite(x1, y1, x2, y2))
+        return surface.blit(sprite, (x1 + offset_x, y1 + offset_y))
+        
+    def render_snake_sprite(self, x1, y1, x2, y2):
+        """Snake from (x1, y1) to (x2, y2) on a transparent sprite, with its offset from the head"""
         # Calculate midpoints for Bezier curve
         dx = x2 - x1
         dy = y2 - y1
@@ -889,6 +737,15 @@ class Board:
             y += perp_y * wave
             
             points.append((x, y))
+            
+        # Sprite covering the body and head, placed on whole pixels so the drawing is unchanged
+        margin = 10
+        left = math.floor(min(x for x, _ in points)) - margin
+        top = math.floor(min(y for _, y in points)) - margin
+        width = math.ceil(max(x for x, _ in points)) + margin - left
+        height = math.ceil(max(y for _, y in points)) + margin - top
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+        points = [(x - left, y - top) for x, y in points]
         
         # Draw the snake body with gradient
         for i in range(len(points) - 1):
@@ -899,20 +756,32 @@ class Board:
                 int(SNAKE_COLOR[1] * (1 - progress) + WARNING_COLOR[1] * progress),
                 int(SNAKE_COLOR[2] * (1 - progress) + WARNING_COLOR[2] * progress)
             )
-            pygame.draw.line(screen, color, points[i], points[i+1], int(thickness))
+            pygame.draw.line(sprite, color, points[i], points[i+1], int(thickness))
         
         # Draw snake head
-        pygame.draw.circle(screen, SNAKE_COLOR, points[0], 8)
-        pygame.draw.circle(screen, BLACK, points[0], 8, 1)
+        pygame.draw.circle(sprite, SNAKE_COLOR, points[0], 8)
+        pygame.draw.circle(sprite, BLACK, points[0], 8, 1)
         
         # Draw eyes
-        pygame.draw.circle(screen, WHITE, (points[0][0] - 3, points[0][1] - 3), 3)
-        pygame.draw.circle(screen, WHITE, (points[0][0] + 3, points[0][1] - 3), 3)
-        pygame.draw.circle(screen, BLACK, (points[0][0] - 3, points[0][1] - 3), 1)
-        pygame.draw.circle(screen, BLACK, (points[0][0] + 3, points[0][1] - 3), 1)
+        pygame.draw.circle(sprite, WHITE, (points[0][0] - 3, points[0][1] - 3), 3)
+        pygame.draw.circle(sprite, WHITE, (points[0][0] + 3, points[0][1] - 3), 3)
+        pygame.draw.circle(sprite, BLACK, (points[0][0] - 3, points[0][1] - 3), 1)
+        pygame.draw.circle(sprite, BLACK, (points[0][0] + 3, points[0][1] - 3), 1)
+        return sprite.convert_alpha(), (left - x1, top - y1)
 
-    def draw_ladder(self, x1, y1, x2, y2):
+    def draw_ladder(self, x1, y1, x2, y2, surface=None):
         """Draw a simple diagonal ladder"""
+        if surface is None:
+            surface = screen
+            
+        # Rotating is the expensive part, so each ladder is rendered once per resolution
+        sprite, position = ladder_sprites.get(
+            (x1, y1, x2, y2, SCREEN_WIDTH, SCREEN_HEIGHT),
+            lambda: self.render_ladder_sprite(x1, y1, x2, y2))
+        return surface.blit(sprite, position)
+        
+    def render_ladder_sprite(self, x1, y1, x2, y2):
+        """Rotated ladder from (x1, y1) to (x2, y2), with where to blit it on the board"""
         # Calculate direction and length
         dx = x2 - x1
         dy = y2 - y1
@@ -958,225 +827,14 @@ class Board:
         pos_x = max(board_x, min(pos_x, board_x + BOARD_SIZE - rotated_ladder.get_width()))
         pos_y = max(board_y, min(pos_y, board_y + BOARD_SIZE - rotated_ladder.get_height()))
         
-        # Draw the ladder
-        screen.blit(rotated_ladder, (pos_x, pos_y))
-
-    def remove_random_snake(self):
-        """Remove a random snake from the board"""
-        if self.snakes:
-            snake_head = random.choice(list(self.snakes.keys()))
-            del self.snakes[snake_head]
-            return True
-        return False
-    
-    def add_power_up(self, position):
-        """Add a random power-up at the given position"""
-        if len(self.power_ups) >= self.max_power_ups:
-            return False
-            
-        if position not in self.snakes and position not in self.ladders:
-            power_up = random.choice(list(POWER_UPS.keys()))
-            self.power_ups[position] = power_up
-            self.gift_boxes.add(position)
-            return True
-        return False
-
-    def get_snake_length(self, position):
-        """Calculate optimal snake length based on position and difficulty"""
-        # Base length starts smaller and increases with position
-        base_length = 5  # Reduced from 10 to start with smaller snakes
-        
-        # Calculate progress (0 to 1)
-        progress = position / 100
-        
-        # Snake length increases with:
-        # 1. Higher difficulty
-        # 2. Closer to goal
-        # 3. Current progress
-        difficulty_multiplier = {
-            "easy": 0.8,
-            "medium": 1.2,
-            "hard": 1.6
-        }[self.difficulty]
-        
-        # Exponential increase in snake length near goal
-        position_multiplier = 1 + (position / 100) ** 2  # Quadratic increase
-        progress_multiplier = 1 + progress * 2  # Doubled progress impact
-        
-        # Calculate final length
-        length = int(base_length * difficulty_multiplier * position_multiplier * progress_multiplier)
-        
-        # Ensure minimum length of 3 and maximum of 30
-        return max(3, min(30, length))
+        return rotated_ladder.convert_alpha(), (pos_x, pos_y)
 
-    def evaluate_position(self, position):
-        """Enhanced evaluation function with difficulty-based scoring"""
-        settings = self.difficulty_settings[self.difficulty]
-        
-        # Base evaluation based on position
-        evaluation = (100 - position) * 10
-        
-        # Consider difficulty level
-        difficulty_factor = {
-            "easy": 0.5,
-            "medium": 1.0,
-            "hard": 1.5
-        }[self.difficulty]
-        
-        # Enhanced snake evaluation
-        snake_score = 0
-        for snake_start, snake_end in self.snakes.items():
-            snake_length = snake_start - snake_end
-            
-            # Strategic positioning factors
-            position_factor = 1.0
-            
-            # Snakes near goal are more dangerous
-            if snake_start >= 90:
-                position_factor *= 2.0
-            elif snake_start >= 70:
-                position_factor *= 1.5
-                
-            # Snakes that create "traps" are more effective
-            if snake_start - snake_end > 10:
-                position_factor *= 1.3
-                
-            # Snakes that block common paths are more effective
-            if snake_start % 10 in [5, 6, 7, 8, 9]:
-                position_factor *= 1.2
-                
-            # Add difficulty-based aggression
-            position_factor *= settings["snake_aggression"]
-                
-            snake_score += snake_length * position_factor * difficulty_factor
-            
-        # Enhanced ladder evaluation
-        ladder_score = 0
-        for ladder_start, ladder_end in self.ladders.items():
-            ladder_length = ladder_end - ladder_start
-            
-            # Strategic positioning factors
-            position_factor = 1.0
-            
-            # Ladders near start are more helpful
-            if ladder_start <= 30:
-                position_factor *= 1.5
-            elif ladder_start <= 50:
-                position_factor *= 1.2
-                
-            # Ladders that bypass snakes are more effective
-            if any(snake_start > ladder_start and snake_start < ladder_end 
-                  for snake_start in self.snakes.keys()):
-                position_factor *= 0.7
-                
-            # Add difficulty-based adjustment
-            position_factor *= (2 - settings["snake_aggression"])  # Inverse of snake aggression
-                
-            ladder_score += ladder_length * position_factor * difficulty_factor
-            
-        # Combine scores with difficulty-based weighting
-        final_score = evaluation - snake_score + ladder_score
-        return final_score
-
-    def minimax(self, position, depth=None, alpha=float('-inf'), beta=float('inf'), is_maximizing=True):
-        """Enhanced minimax algorithm with difficulty-based depth"""
-        if depth is None:
-            depth = self.difficulty_settings[self.difficulty]["minimax_depth"]
-            
-        # Cache key for current state
-        cache_key = (position, depth, is_maximizing)
-        if cache_key in self.evaluation_cache:
-            return self.evaluation_cache[cache_key]
-            
-        # Base cases
-        if depth == 0 or position >= 100:
-            return self.evaluate_position(position)
-            
-        if is_maximizing:
-            # AI's turn - trying to maximize difficulty
-            max_eval = float('-inf')
-            
-            # Calculate potential snake positions based on player's position
-            potential_positions = self.get_potential_snake_positions(position)
-            
-            for potential_pos in potential_positions:
-                if potential_pos not in self.snakes and potential_pos not in self.ladders and potential_pos < 100:
-                    # Simulate snake placement
-                    original_snakes = self.snakes.copy()
-                    snake_length = self.get_snake_length(potential_pos)
-                    self.snakes[potential_pos] = max(1, potential_pos - snake_length)
-                    
-                    # Recursive call with difficulty-based depth
-                    eval = self.minimax(position, depth - 1, alpha, beta, False)
-                    max_eval = max(max_eval, eval)
-                    
-                    # Restore original state
-                    self.snakes = original_snakes
-                    
-                    # Alpha-beta pruning
-                    alpha = max(alpha, eval)
-                    if beta <= alpha:
-                        break
-                        
-            self.evaluation_cache[cache_key] = max_eval
-            return max_eval
-        else:
-            # Player's turn - trying to minimize difficulty
-            min_eval = float('inf')
-            
-            # Consider different dice rolls with difficulty-based weights
-            dice_weights = {
-                "easy": [0.03, 0.07, 0.15, 0.2, 0.25, 0.3],    # Favor higher numbers
-                "medium": [1/6] * 6,                           # Equal probability
-                "hard": [0.3, 0.25, 0.2, 0.15, 0.07, 0.03]     # Favor lower numbers
-            }[self.difficulty]
-            
-            for dice in range(1, 7):
-                # Apply dice weights
-                weight = dice_weights[dice-1]
-                new_pos = min(position + dice, 100)
-                
-                if new_pos in self.snakes:
-                    new_pos = self.snakes[new_pos]
-                elif new_pos in self.ladders:
-                    new_pos = self.ladders[new_pos]
-                    
-                eval = self.minimax(new_pos, depth - 1, alpha, beta, True)
-                min_eval = min(min_eval, eval * weight)  # Weight the evaluation
-                
-                # Alpha-beta pruning
-                beta = min(beta, eval)
-                if beta <= alpha:
-                    break
-                    
-            self.evaluation_cache[cache_key] = min_eval
-            return min_eval
-
-class Dice:
+class Dice(engine.Dice):
     def __init__(self):
-        self.value = 1
-        self.rolling = False
-        self.roll_frames = 0
-        self.total_frames = 20
+        super().__init__()
         self.x = SCREEN_WIDTH - 150
         self.y = SCREEN_HEIGHT // 2
         
-    def roll(self):
-        self.rolling = True
-        self.roll_frames = 0
-        self.value = random.randint(1, 6)
-        
-    def update(self):
-        if self.rolling:
-            self.roll_frames += 1
-            if self.roll_frames < self.total_frames:
-                # Show random values while rolling
-                self.value = random.randint(1, 6)
-            else:
-                self.rolling = False
-                return True
-        return False
-                
     def draw(self):
         # Draw dice with 3D effect
         size = DICE_SIZE
@@ -1213,6 +871,12 @@ class Dice:
             x = self.x + pos[0] * size * 0.6
             y = self.y + pos[1] * size * 0.6
             pygame.draw.circle(screen, dot_color, (int(x), int(y)), size // 10)
+            
+    def region(self):
+        """Screen rect of the dice, with what is drawn there"""
+        size = DICE_SIZE
+        rect = pygame.Rect(self.x - size//2, self.y - size//2, size, size)
+        return rect, (self.value, self.rolling and self.roll_frames)
 
 class Button:
     def __init__(self, x, y, width, height, text, color=BUTTON_COLOR):
@@ -1245,8 +909,8 @@ class Button:
         pygame.draw.rect(screen, BLACK, self.rect, 2, border_radius=10)
         
         # Draw text with shadow
-        text_surface = button_font.render(self.text, True, TEXT_LIGHT)
-        text_shadow = button_font.render(self.text, True, BLACK)
+        text_surface = render_text(button_font, self.text, TEXT_LIGHT)
+        text_shadow = render_text(button_font, self.text, BLACK)
         
         # Center text
         text_rect = text_surface.get_rect(center=self.rect.center)
@@ -1256,30 +920,78 @@ class Button:
         screen.blit(text_shadow, shadow_rect)
         screen.blit(text_surface, text_rect)
         
+    def region(self):
+        """Screen rect of the button and its shadow, with whether it is drawn hovered"""
+        rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width + 3, self.rect.height + 3)
+        return rect, self.rect.collidepoint(pygame.mouse.get_pos())
+        
     def reset(self):
         """Reset button state"""
         self.pressed = False
 
-class Game:
-    def __init__(self):
-        self.board = Board()
-        self.player = Player(PLAYER_COLOR, "Player", (0, 0))
-        self.dice = Dice()
-        self.state = "difficulty"  # difficulty, playing, end
-        self.difficulty = None
-        self.time_left = 0
-        self.start_time = 0
-        self.message = ""
-        self.message_time = 0
-        self.last_dice_value = 0
-        self.previous_position = 1
-        self.power_up_cooldown = 0  # Cooldown for power-up usage
-        self.power_up_cooldown_time = 1000  # 1 second cooldown in milliseconds
-        self.last_time_update = 0  # Track last time update for smooth display
-        self.time_boost = 0  # Track additional time from boosts
-        self.snake_bite = False  # Add flag for snake bite state
-        self.snake_bite_position = None  # Store snake bite position
-        self.snake_bite_target = None  # Store snake bite target position
+CONFETTI_PARTICLES = 150
+
+class Confetti:
+    """Falling confetti held as NumPy arrays, moved in bulk and drawn with one blits call"""
+    def __init__(self, count, colors):
+        import numpy as np
+        # Seeded from random, so seeding the game also fixes the confetti
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self.x = self.rng.integers(0, SCREEN_WIDTH, count, endpoint=True).astype(float)
+        self.y = self.rng.integers(-SCREEN_HEIGHT, 0, count, endpoint=True).astype(float)
+        self.size = self.rng.integers(5, 15, count, endpoint=True)
+        self.speed = self.rng.uniform(2, 8, count)
+        self.angle = self.rng.uniform(0, math.pi * 2, count)
+        self.color_index = self.rng.integers(0, len(colors), count)
+        self.drift = np.sin(self.angle) * 2  # Horizontal movement per frame
+        
+        # One solid square per color and size, shared by every particle that looks like it
+        squares = {}
+        for index, size in set(zip(self.color_index.tolist(), self.size.tolist())):
+            square = squares[index, size] = pygame.Surface((size, size)).convert()
+            square.fill(colors[index])
+        self.sprites = [squares[key] for key in zip(self.color_index.tolist(), self.size.tolist())]
+        
+    def update(self):
+        # Add gravity and some horizontal movement
+        self.y += self.speed
+        self.x += self.drift
+        # Particles that fell off screen start again from the top
+        fallen = self.y > SCREEN_HEIGHT
+        count = int(fallen.sum())
+        if count:
+            self.y[fallen] = self.rng.integers(-50, 0, count, endpoint=True)
+            self.x[fallen] = self.rng.integers(0, SCREEN_WIDTH, count, endpoint=True)
+            
+    def draw(self, surface):
+        # Truncated like the float rects pygame.draw.rect was given
+        positions = zip(self.x.astype(int).tolist(), self.y.astype(int).tolist())
+        surface.blits(zip(self.sprites, positions), doreturn=False)
+
+def merge_rects(rects):
+    """Union overlapping rects, so no part of the screen is redrawn twice"""
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+# Start screen without its buttons per (screen width, screen height)
+start_screen_layers = {}
+
+class Game(engine.Game):
+    def __init__(self, clock=time.time):
+        super().__init__(clock)
+        if engine.ROOT_SEARCH_WORKERS > 1:
+            # Fork the search processes before any worker thread exists, forking a threaded process can deadlock
+            get_root_search_pool(engine.ROOT_SEARCH_WORKERS)
+        if BACKGROUND_AI:
+            self.board.placement_worker = PlacementWorker(
+                lambda: pygame.event.post(pygame.event.Event(PLACEMENT_READY)))
         
         # Buttons with new colors and positions adjusted for fullscreen
         btn_width, btn_height = 200, 60
@@ -1304,18 +1016,26 @@ class Game:
             btn_width, btn_height, "Play Again", BUTTON_COLOR
         )
         
-        # Animation flags
-        self.animating = False
-        self.animation_done = False
         self.show_win_popup = False
-        self.confetti_particles = []
+        self.confetti = None
+        
+        # What the screen showed after the last draw_dirty
+        self.drawn_layout = None
+        self.drawn_regions = {}
 
-    def set_message(self, text):
-        self.message = text
-        self.message_time = pygame.time.get_ticks()
+    def create_board(self):
+        return Board()
+        
+    def create_player(self):
+        return Player(PLAYER_COLOR, "Player", (0, 0))
         
-    def handle_events(self):
-        for event in pygame.event.get():
+    def create_dice(self):
+        return Dice()
+        
+    def handle_events(self, events=None):
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -1325,6 +1045,11 @@ class Game:
                     sys.exit()
                 elif event.key == pygame.K_r and self.state == "playing":
                     self.restart_game()
+                elif event.key == pygame.K_F3:
+                    frame_timers.toggle()
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.WINDOWRESTORED):
+                # The window was uncovered or restored, so all of it needs drawing, not just what changed
+                self.drawn_layout = None
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if self.state == "difficulty":
                     if self.easy_button.is_clicked(event.pos):
@@ -1338,18 +1063,11 @@ class Game:
                         self.roll_dice()
                     else:
                         # Check power-up usage
-                        current_time = pygame.time.get_ticks()
+                        current_time = self.ticks()
                         if current_time - self.power_up_cooldown >= self.power_up_cooldown_time:
-                            for use_btn, index in self.player.draw_power_ups():
-                                if use_btn.collidepoint(event.pos):
-                                    power_up = self.player.use_power_up(index)
-                                    if power_up:
-                                        self.power_up_cooldown = current_time
-                                        POWER_UPS[power_up]["effect"](self)
-                                        self.set_message(f"Used {POWER_UPS[power_up]['name']}!")
-                                        self.animating = False
-                                        self.animation_done = False
-                                        break
+                            index = self.player.power_up_layout().use_button_at(event.pos)
+                            if index is not None:
+                                self.use_power_up(index)
                 elif self.state == "end":
                     if self.restart_button.is_clicked(event.pos):
                         self.restart_game()
@@ -1364,125 +1082,14 @@ class Game:
                             self.show_win_popup = False
                             self.state = "end"
 
-    def add_time(self, seconds):
-        """Add time to the timer and update display"""
-        self.time_boost += seconds
-        self.time_left += seconds
-        self.set_message(f"Added {seconds} seconds!")
-
-    def start_game(self, difficulty):
-        self.state = "playing"
-        self.difficulty = difficulty
-        self.time_left = DIFFICULTY_TIMES[difficulty]
-        self.start_time = time.time()
-        self.time_boost = 0  # Reset time boost counter
-        
-        # Configure board based on difficulty
-        self.board.configure_difficulty(difficulty)
-        self.board.initialize_gift_boxes()
-        
-        # Reset player position
-        self.player.position = 1
-        self.player.target_position = 1
-        self.player.is_moving = False
-        self.player.move_progress = 0
-        
-        # Reset animation flags
-        self.animating = False
-        self.animation_done = False
-        
-        # Clear any existing messages
-        self.message = ""
-        self.message_time = 0
-
-    def update(self):
-        if self.state == "playing":
-            current_time = time.time()
-            if current_time - self.last_time_update >= 0.1:
-                base_time = DIFFICULTY_TIMES[self.difficulty] - (current_time - self.start_time)
-                self.time_left = max(0, base_time + self.time_boost)
-                self.last_time_update = current_time
-            
-            if self.time_left <= 0:
-                self.state = "end"
-                self.set_message("Time's up! Game Over!")
-                return
-                
-            if self.animating:
-                # Dice rolling animation
-                if self.dice.update() and not self.animation_done:
-                    self.last_dice_value = self.dice.value
-                    self.previous_position = self.player.position
-                    self.player.move(self.dice.value)
-                    self.animation_done = True
-                    self.set_message(f"You rolled a {self.dice.value}")
-                
-                # Player movement animation
-                if self.animation_done:
-                    if self.player.update_animation():
-                        position = self.player.position
-                        
-                        # Check for power-up collection
-                        if position in self.board.power_ups:
-                            power_up = self.board.power_ups[position]
-                            if len(self.player.power_ups) < 3:
-                                self.player.add_power_up(power_up)
-                                del self.board.power_ups[position]
-                                self.board.gift_boxes.remove(position)
-                                self.set_message(f"Collected {POWER_UPS[power_up]['name']}!")
-                            else:
-                                self.set_message("Power-up inventory full!")
-                        
-                        # Update AI with new player position
-                        if position > self.previous_position:
-                            self.board.update_player_position(position)
-                        
-                        # Check for snakes
-                        if position in self.board.snakes and not self.snake_bite:
-                            if self.player.has_immunity:
-                                self.player.has_immunity = False
-                                self.set_message("Immunity protected you from the snake!")
-                                self.animating = False
-                                self.animation_done = False
-                            else:
-                                self.snake_bite = True
-                                self.snake_bite_position = position
-                                self.snake_bite_target = self.board.snakes[position]
-                                # Directly place player at snake end position
-                                self.player.position = self.snake_bite_target
-                                self.player.current_display_pos = self.snake_bite_target
-                                self.set_message("Oh no! You hit a snake!")
-                                self.snake_bite = False
-                                self.snake_bite_position = None
-                                self.snake_bite_target = None
-                                self.animating = False
-                                self.animation_done = False
-                            return
-                            
-                        # Check for ladders
-                        if position in self.board.ladders:
-                            new_pos = self.board.ladders[position]
-                            self.player.position = new_pos
-                            self.player.current_display_pos = new_pos
-                            self.set_message("Yay! You climbed a ladder!")
-                            self.animating = False
-                            self.animation_done = False
-                            return
-                            
-                        # Check for win
-                        if position == 100:
-                            self.state = "end"
-                            self.set_message("Congratulations! You won!")
-                            self.show_win_popup = True
-                            self.create_confetti()
-                            return
-                        
-                        self.animating = False
-                        self.animation_done = False
+    
+    def on_win(self):
+        super().on_win()
+        self.show_win_popup = True
+        self.create_confetti()
     
     def create_confetti(self):
         # Create colorful confetti particles using forest theme colors
-        self.confetti_particles = []
         colors = [
             PRIMARY,      # Forest Green
             SECONDARY,    # Dark Olive Green
@@ -1492,31 +1099,12 @@ class Game:
             GIFT_BOX,    # Medium Orchid
             LADDER_COLOR  # Wood color
         ]
-        for _ in range(150):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(-SCREEN_HEIGHT, 0)
-            size = random.randint(5, 15)
-            speed = random.uniform(2, 8)
-            angle = random.uniform(0, math.pi * 2)
-            color = random.choice(colors)
-            self.confetti_particles.append({
-                'x': x, 'y': y, 'size': size, 'speed': speed, 
-                'angle': angle, 'color': color
-            })
+        self.confetti = Confetti(CONFETTI_PARTICLES, colors)
     
     def update_confetti(self):
         # Update confetti animation
-        if not self.confetti_particles:
-            return
-            
-        for particle in self.confetti_particles:
-            # Add gravity and some horizontal movement
-            particle['y'] += particle['speed']
-            particle['x'] += math.sin(particle['angle']) * 2
-            # If particle goes off screen, reset from top
-            if particle['y'] > SCREEN_HEIGHT:
-                particle['y'] = random.randint(-50, 0)
-                particle['x'] = random.randint(0, SCREEN_WIDTH)
+        if self.confetti is not None:
+            self.confetti.update()
     
     def draw_win_popup(self):
         if not self.show_win_popup:
@@ -1524,12 +1112,8 @@ class Game:
             
         # Update and draw confetti
         self.update_confetti()
-        for particle in self.confetti_particles:
-            pygame.draw.rect(
-                screen, 
-                particle['color'], 
-                (particle['x'], particle['y'], particle['size'], particle['size'])
-            )
+        if self.confetti is not None:
+            self.confetti.draw(screen)
         
         # Draw popup window
         popup_width, popup_height = 500, 300
@@ -1554,8 +1138,8 @@ class Game:
         
         # Draw congratulations text with shadow
         text = "CONGRATULATIONS!"
-        shadow_text = title_font.render(text, True, TEXT_PRIMARY)
-        main_text = title_font.render(text, True, PRIMARY)
+        shadow_text = render_text(title_font, text, TEXT_PRIMARY)
+        main_text = render_text(title_font, text, PRIMARY)
         
         text_rect = main_text.get_rect(center=(SCREEN_WIDTH // 2, popup_y + 80))
         shadow_rect = shadow_text.get_rect(center=(text_rect.centerx + 3, text_rect.centery + 3))
@@ -1574,7 +1158,7 @@ class Game:
         ]
         
         for i, line in enumerate(win_message):
-            text = info_font.render(line, True, TEXT_PRIMARY)
+            text = render_text(info_font, line, TEXT_PRIMARY)
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, popup_y + 140 + i * 30))
             screen.blit(text, rect)
         
@@ -1595,7 +1179,7 @@ class Game:
         pygame.draw.rect(screen, BLACK,
                         close_btn_rect, 2, border_radius=15)
         
-        close_text = info_font.render("×", True, WHITE)
+        close_text = render_text(info_font, "×", WHITE)
         close_rect = close_text.get_rect(center=close_btn_rect.center)
         screen.blit(close_text, close_rect)
         
@@ -1605,13 +1189,37 @@ class Game:
     
     def draw_start_screen(self):
         """Draw the start screen with forest theme"""
+        # Draw difficulty buttons with proper spacing
+        btn_y_start = SCREEN_HEIGHT // 2 + 50
+        btn_spacing = 100
+        
+        # Easy button
+        self.easy_button.rect.centerx = SCREEN_WIDTH // 2
+        self.easy_button.rect.y = btn_y_start
+        
+        # Medium button
+        self.medium_button.rect.centerx = SCREEN_WIDTH // 2
+        self.medium_button.rect.y = btn_y_start + btn_spacing
+        
+        # Hard button
+        self.hard_button.rect.centerx = SCREEN_WIDTH // 2
+        self.hard_button.rect.y = btn_y_start + btn_spacing * 2
+        
+        # Everything but the buttons is composed once per resolution
+        layer = start_screen_layers.get((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if layer is None:
+            layer = start_screen_layers[SCREEN_WIDTH, SCREEN_HEIGHT] = self.render_start_screen_layer()
+        screen.blit(layer, (0, 0))
+        
+        # Buttons change color on hover, so they are drawn every frame
+        self.easy_button.draw()
+        self.medium_button.draw()
+        self.hard_button.draw()
+        
+    def render_start_screen_layer(self):
+        """Start screen background, trees, title, description and button times on one surface"""
         # Fill background with forest gradient
-        for y in range(SCREEN_HEIGHT):
-            progress = y / SCREEN_HEIGHT
-            r = int(CELL_COLOR_1[0] + (CELL_COLOR_2[0] - CELL_COLOR_1[0]) * progress)
-            g = int(CELL_COLOR_1[1] + (CELL_COLOR_2[1] - CELL_COLOR_1[1]) * progress)
-            b = int(CELL_COLOR_1[2] + (CELL_COLOR_2[2] - CELL_COLOR_1[2]) * progress)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        layer = vertical_gradient(CELL_COLOR_1, CELL_COLOR_2).copy()
 
         # Draw forest elements (trees at corners)
         tree_positions = [
@@ -1625,21 +1233,21 @@ class Game:
             # Draw simple tree
             trunk_width = 40
             trunk_height = 120
-            pygame.draw.rect(screen, TREE_COLORS[0],
+            pygame.draw.rect(layer, TREE_COLORS[0],
                            (x - trunk_width//2, y - trunk_height, trunk_width, trunk_height))
             
             # Draw tree crown
             crown_radius = 60
-            pygame.draw.circle(screen, LEAF_COLORS[0],
+            pygame.draw.circle(layer, LEAF_COLORS[0],
                              (x, y - trunk_height), crown_radius)
         
         # Draw title
-        title_shadow = title_font.render("Snakes and Ladders", True, TEXT_PRIMARY)
-        title_text = title_font.render("Snakes and Ladders", True, PRIMARY)
+        title_shadow = render_text(title_font, "Snakes and Ladders", TEXT_PRIMARY)
+        title_text = render_text(title_font, "Snakes and Ladders", PRIMARY)
         
         title_y = SCREEN_HEIGHT // 6
-        screen.blit(title_shadow, title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 3, title_y + 3)))
-        screen.blit(title_text, title_text.get_rect(center=(SCREEN_WIDTH // 2, title_y)))
+        layer.blit(title_shadow, title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 3, title_y + 3)))
+        layer.blit(title_text, title_text.get_rect(center=(SCREEN_WIDTH // 2, title_y)))
         
         # Draw game description panel
         desc_panel = pygame.Surface((600, 200), pygame.SRCALPHA)  # Reduced height
@@ -1659,39 +1267,21 @@ class Game:
         for line in description:
             color = PRIMARY if line.startswith("Welcome") else TEXT_PRIMARY
             font = button_font if line.startswith("Welcome") else info_font
-            text = font.render(line, True, color)
+            text = render_text(font, line, color)
             desc_panel.blit(text, (30, desc_y))
             desc_y += 35
         
-        screen.blit(desc_panel, ((SCREEN_WIDTH - 600) // 2, title_y + 100))
-        
-        # Draw difficulty buttons with proper spacing
-        btn_y_start = SCREEN_HEIGHT // 2 + 50
-        btn_spacing = 100
-        
-        # Easy button
-        self.easy_button.rect.centerx = SCREEN_WIDTH // 2
-        self.easy_button.rect.y = btn_y_start
-        self.easy_button.draw()
-        
-        # Medium button
-        self.medium_button.rect.centerx = SCREEN_WIDTH // 2
-        self.medium_button.rect.y = btn_y_start + btn_spacing
-        self.medium_button.draw()
-        
-        # Hard button
-        self.hard_button.rect.centerx = SCREEN_WIDTH // 2
-        self.hard_button.rect.y = btn_y_start + btn_spacing * 2
-        self.hard_button.draw()
+        layer.blit(desc_panel, ((SCREEN_WIDTH - 600) // 2, title_y + 100))
         
-        # Draw time info below each button
+        # Draw time info below each button, clear of the button shadows
         for i, (btn, diff) in enumerate([(self.easy_button, "easy"), 
                                        (self.medium_button, "medium"),
                                        (self.hard_button, "hard")]):
             minutes = DIFFICULTY_TIMES[diff] // 60
-            time_text = info_font.render(f"{minutes} min", True, TEXT_PRIMARY)
+            time_text = render_text(info_font, f"{minutes} min", TEXT_PRIMARY)
             time_rect = time_text.get_rect(center=(btn.rect.centerx, btn.rect.bottom + 20))
-            screen.blit(time_text, time_rect)
+            layer.blit(time_text, time_rect)
+        return layer
 
     def draw_decorative_elements(self):
         """Simplified forest theme decorations"""
@@ -1718,14 +1308,14 @@ class Game:
         else:
             message = "Game Over!"
             
-        text = title_font.render(message, True, WHITE)
+        text = render_text(title_font, message, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         screen.blit(text, text_rect)
         
         # Draw final score
         minutes = int(DIFFICULTY_TIMES[self.difficulty] - self.time_left) // 60
         seconds = int(DIFFICULTY_TIMES[self.difficulty] - self.time_left) % 60
-        score_text = info_font.render(f"Time taken: {minutes:02d}:{seconds:02d}", True, WHITE)
+        score_text = render_text(info_font, f"Time taken: {minutes:02d}:{seconds:02d}", WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         screen.blit(score_text, score_rect)
         
@@ -1733,13 +1323,10 @@ class Game:
         self.restart_button.draw()
 
     def draw(self):
-        # Fill background with a gradient
-        for y in range(SCREEN_HEIGHT):
-            progress = y / SCREEN_HEIGHT
-            r = int(BOARD_BG[0] + (SECONDARY[0] - BOARD_BG[0]) * progress)
-            g = int(BOARD_BG[1] + (SECONDARY[1] - BOARD_BG[1]) * progress)
-            b = int(BOARD_BG[2] + (SECONDARY[2] - BOARD_BG[2]) * progress)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # Fill background with a gradient, the start screen covers it with its own
+        if self.state != "difficulty":
+            screen.blit(vertical_gradient(BOARD_BG, SECONDARY), (0, 0))
+        frame_timers.mark("background")
             
         if self.state == "difficulty":
             # Draw start screen
@@ -1747,6 +1334,7 @@ class Game:
         elif self.state == "playing":
             # Draw game board
             self.board.draw()
+            frame_timers.mark("board")
             
             # Draw player
             self.player.draw(self.board)
@@ -1756,10 +1344,11 @@ class Game:
             
             # Draw roll button
             self.roll_button.draw()
+            frame_timers.mark("pieces")
             
             # Draw power-ups panel
-            for _ in self.player.draw_power_ups():
-                pass  # Just draw the power-ups panel
+            self.player.draw_power_ups()
+            frame_timers.mark("power_ups")
             
             # Draw timer with improved visibility
             minutes = int(self.time_left) // 60
@@ -1770,17 +1359,12 @@ class Game:
             pygame.draw.rect(timer_bg, (*BLACK, 100), timer_bg.get_rect(), border_radius=8)
             screen.blit(timer_bg, (20, 20))
             
-            # Draw timer text with shadow
-            timer_text = info_font.render(f"Time: {minutes:02d}:{seconds:02d}", True, TEXT_LIGHT)
-            timer_shadow = info_font.render(f"Time: {minutes:02d}:{seconds:02d}", True, BLACK)
-            
-            # Draw shadow first
-            screen.blit(timer_shadow, (22, 22))
-            # Draw main text
-            screen.blit(timer_text, (20, 20))
+            # Draw timer text with shadow, shadow first
+            draw_clock_text("Time: ", minutes, seconds, info_font, BLACK, (22, 22))
+            draw_clock_text("Time: ", minutes, seconds, info_font, TEXT_LIGHT, (20, 20))
             
             # Draw message if any
-            if self.message and pygame.time.get_ticks() - self.message_time < 2000:
+            if self.message and self.ticks() - self.message_time < 2000:
                 # Draw message background
                 message_bg = pygame.Surface((400, 50), pygame.SRCALPHA)  # Increased size for fullscreen
                 pygame.draw.rect(message_bg, (*BLACK, 100), message_bg.get_rect(), border_radius=8)
@@ -1788,8 +1372,8 @@ class Game:
                 screen.blit(message_bg, message_rect)
                 
                 # Draw message text with shadow
-                message_text = info_font.render(self.message, True, TEXT_LIGHT)
-                message_shadow = info_font.render(self.message, True, BLACK)
+                message_text = render_text(info_font, self.message, TEXT_LIGHT)
+                message_shadow = render_text(info_font, self.message, BLACK)
                 
                 # Draw shadow first
                 shadow_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2 + 2, 52))
@@ -1800,33 +1384,175 @@ class Game:
         elif self.state == "end":
             # Draw end screen
             self.draw_end_screen()
+        frame_timers.mark("screen")
             
         # Draw win popup if needed
         if self.show_win_popup:
             self.draw_win_popup()
+            frame_timers.mark("popup")
+            
+        if frame_timers.enabled:
+            self.draw_performance_hud()
+            frame_timers.mark("hud")
+            
+    def idle_timeout(self):
+        """Milliseconds the main loop can sleep waiting for input, 0 while something animates"""
+        if self.animating or self.dice.rolling or self.show_win_popup or frame_timers.enabled:
+            return 0
+        if self.state != "playing":
+            return IDLE_WAKE_MS  # Menus only change on input
+            
+        # Wake when the countdown shows the next second, once update_timer will refresh it
+        now = self.clock()
+        time_left = DIFFICULTY_TIMES[self.difficulty] - (now - self.start_time) + self.time_boost
+        next_second = max(time_left - math.ceil(time_left) + 1, self.last_time_update + 0.1 - now)
+        timeout = min(IDLE_WAKE_MS, next_second * 1000)
+        
+        # and when the message box closes
+        message_age = self.ticks() - self.message_time
+        if self.message and message_age < 2000:
+            timeout = min(timeout, 2000 - message_age)
+        if self.board.gift_boxes:
+            timeout = min(timeout, 1000 / GIFT_BOX_IDLE_FPS)
+        return max(1, int(timeout) + 1)
+        
+    def layout_signature(self):
+        """Everything that needs the whole screen redrawn when it changes"""
+        return (self.state, self.show_win_popup, frame_timers.enabled,
+                self.board.layout_hash, SCREEN_WIDTH, SCREEN_HEIGHT)
+        
+    def regions(self):
+        """{component: (screen rect, what is drawn there)} for the parts of the screen that change"""
+        if self.show_win_popup or frame_timers.enabled:
+            return None  # Confetti and the HUD change every frame, so those screens are redrawn whole
+        if self.state == "difficulty":
+            return {button.text: button.region()
+                    for button in (self.easy_button, self.medium_button, self.hard_button)}
+        if self.state == "end":
+            return {"restart": self.restart_button.region()}
+            
+        regions = {
+            "player": self.player.region(self.board),
+            "dice": self.dice.region(),
+            "roll": self.roll_button.region(),
+            "power_ups": self.player.power_up_region(),
+            "timer": self.timer_region(),
+            "message": self.message_region()
+        }
+        for position, region in self.board.gift_box_regions():
+            regions["gift", position] = region
+        return regions
+        
+    def timer_region(self):
+        """Screen rect of the timer box and its text shadow, with the time shown"""
+        rect = pygame.Rect(20, 20, 200 + 2, 50 + 2)
+        return rect, (int(self.time_left) // 60, int(self.time_left) % 60)
+        
+    def message_region(self):
+        """Screen rect of the message box and its text, with the message shown"""
+        rect = pygame.Rect(0, 0, 400, 50)
+        rect.center = (SCREEN_WIDTH // 2, 50)
+        text_rect = render_text(info_font, self.message, TEXT_LIGHT).get_rect(center=(SCREEN_WIDTH // 2, 50))
+        rect.union_ip(text_rect.inflate(4, 4))  # Long messages overflow the box, the shadow is 2px off
+        visible = self.message and self.ticks() - self.message_time < 2000
+        return rect, self.message if visible else None
+        
+    def draw_dirty(self):
+        """Redraw the parts of the screen that changed since the last call, returning their rects"""
+        layout = self.layout_signature()
+        regions = self.regions()
+        if regions is None or layout != self.drawn_layout:
+            self.draw()
+            self.drawn_layout = layout
+            self.drawn_regions = regions or {}
+            return [screen.get_rect()]
+            
+        changed = []
+        for key in regions.keys() | self.drawn_regions.keys():
+            old = self.drawn_regions.get(key)
+            new = regions.get(key)
+            if old != new:
+                # Repaint where the component was and where it is now
+                changed.extend(region[0] for region in (old, new) if region)
+        self.drawn_regions = regions
+        
+        dirty = [rect.clip(screen.get_rect()) for rect in merge_rects(changed)]
+        for rect in dirty:
+            # The whole scene is drawn through the clip, so overlaps come out as in a full redraw
+            screen.set_clip(rect)
+            self.draw()
+        screen.set_clip(None)
+        return dirty
+            
+    def draw_performance_hud(self):
+        """Frame time overlay, toggled with F3"""
+        rows = [("phase", "now", "p50", "p95", "max")]
+        for phase in frame_timers.samples:
+            rows.append((phase, *(f"{ms:.2f}" for ms in frame_timers.stats(phase))))
+        placement_ms = self.board.last_placement_ms
+        placement_text = "-" if placement_ms is None else f"{placement_ms:.2f} ms"
+        cache_text = f"Text cache: {text_cache.hits} hits, {text_cache.misses} misses"
+        
+        # Numbers change every frame, so they bypass the text cache
+        line_height = 20
+        column_right = [0, 150, 200, 250, 300]  # Right edge of each number column
+        hud = pygame.Surface((320, (len(rows) + 2) * line_height + 16), pygame.SRCALPHA)
+        pygame.draw.rect(hud, (*BLACK, 180), hud.get_rect(), border_radius=8)
+        for i, row in enumerate(rows):
+            y = 8 + i * line_height
+            hud.blit(cell_font.render(row[0], True, TEXT_LIGHT), (10, y))
+            for text, right in zip(row[1:], column_right[1:]):
+                text_surface = cell_font.render(text, True, TEXT_LIGHT)
+                hud.blit(text_surface, text_surface.get_rect(topright=(right, y)))
+        hud.blit(cell_font.render(f"AI placement: {placement_text}", True, TEXT_LIGHT),
+                 (10, 8 + len(rows) * line_height))
+        hud.blit(cell_font.render(cache_text, True, TEXT_LIGHT),
+                 (10, 8 + (len(rows) + 1) * line_height))
+        screen.blit(hud, (20, SCREEN_HEIGHT - hud.get_height() - 20))
 
-    def roll_dice(self):
-        """Handle dice rolling"""
-        if not self.animating:
-            self.dice.roll()
-            self.animating = True
-            self.animation_done = False
-            self.set_message("Rolling...")
-
-    def restart_game(self):
-        """Restart the game"""
-        self.__init__()
+def report_startup(verbose):
+    """Check the startup budget, printing the whole timeline when verbose"""
+    startup_mark("first frame shown")
+    total_ms = startup_timeline[-1][1]
+    if verbose:
+        previous_ms = 0.0
+        for label, ms in startup_timeline:
+            print(f"{ms:8.1f} ms  +{ms - previous_ms:7.1f} ms  {label}")
+            previous_ms = ms
+    if total_ms > STARTUP_BUDGET_MS:
+        print(f"Startup took {total_ms:.0f} ms, over the {STARTUP_BUDGET_MS} ms budget")
 
 def main():
+    init_display()
     game = Game()
+    startup_mark("create game")
+    first_frame = True
+    dirty_rects = DIRTY_RECTS and "--full-redraw" not in sys.argv
     
     # Main game loop
     while True:
-        game.handle_events()
+        events = None
+        timeout = game.idle_timeout() if IDLE_PACING else 0
+        if timeout:
+            # Nothing is moving, sleep until input arrives or the screen is due to change
+            event = pygame.event.wait(timeout)
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+            
+        frame_timers.start_frame()
+        game.handle_events(events)
+        frame_timers.mark("events")
         game.update()
-        game.draw()
-        
-        pygame.display.flip()
+        frame_timers.mark("update")
+        if dirty_rects:
+            pygame.display.update(game.draw_dirty())
+        else:
+            game.draw()
+            pygame.display.flip()
+        frame_timers.mark("flip")
+        frame_timers.end_frame()
+        if first_frame:
+            first_frame = False
+            report_startup("--startup-profile" in sys.argv)
         clock.tick(60)
 
 if __name__ == "__main__":
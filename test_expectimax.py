@@ -0,0 +1,71 @@
+"""Star1/Star2 pruned expectimax against a plain expectimax reference on seeded boards"""
+import math
+import pytest
+import engine
+from benchmarks import build_board
+
+def reference_max(board, position, depth):
+    """Unpruned AI node, the same placements as Board.expectimax_max"""
+    if depth == 0 or position >= 100:
+        return board.evaluate_position(position)
+    candidates = board.placement_candidates(position)
+    if not candidates:
+        return reference_chance(board, position, depth - 1)
+    best = float('-inf')
+    for potential_pos in candidates:
+        board.add_snake(potential_pos, max(1, potential_pos - board.get_snake_length(potential_pos)))
+        try:
+            best = max(best, reference_chance(board, position, depth - 1))
+        finally:
+            board.remove_snake(potential_pos)
+    return best
+
+def reference_chance(board, position, depth):
+    """Unpruned player node, the probability weighted sum over every roll"""
+    if depth == 0 or position >= 100:
+        return board.evaluate_position(position)
+    return sum(prob * reference_max(board, new_pos, depth - 1)
+               for new_pos, prob in board.dice_outcomes(position))
+
+CASES = [(difficulty, seed, position, depth)
+         for difficulty in ("easy", "hard")
+         for seed in range(3)
+         for position in (5, 37, 68, 91)
+         for depth in (2, 3)]
+
+@pytest.mark.parametrize("difficulty,seed,position,depth", CASES)
+def test_full_window_matches_reference(difficulty, seed, position, depth):
+    board = build_board(engine.Board, difficulty, 12, seed)
+    expected = reference_chance(board, position, depth)
+    board.transposition_table.clear()
+    assert math.isclose(board.expectimax(position, depth, is_maximizing=False), expected, abs_tol=1e-9)
+
+@pytest.mark.parametrize("difficulty,seed,position,depth", CASES)
+@pytest.mark.parametrize("offset", [-50.0, -5.0, -0.5, 0.5, 5.0, 50.0])
+def test_windows_bound_the_reference(difficulty, seed, position, depth, offset):
+    board = build_board(engine.Board, difficulty, 12, seed)
+    expected = reference_chance(board, position, depth)
+    # Narrow windows entirely above (fail-low) or below (fail-high) the true value
+    alpha, beta = sorted((expected + offset, expected + offset * 2))
+    board.transposition_table.clear()
+    value = board.expectimax(position, depth, alpha, beta, is_maximizing=False)
+    if value <= alpha:
+        assert expected <= value + 1e-9
+    elif value >= beta:
+        assert expected >= value - 1e-9
+    else:
+        assert math.isclose(value, expected, abs_tol=1e-9)
+    if offset > 0:
+        assert value <= alpha + 1e-9
+    else:
+        assert value >= beta - 1e-9
+
+def test_shared_transposition_table_across_windows():
+    # Entries stored under one window must stay sound when probed under another
+    board = build_board(engine.Board, "hard", 12, 7)
+    for position in (12, 45, 77):
+        expected = reference_chance(board, position, 3)
+        for alpha, beta in ((expected + 1, expected + 2), (expected - 2, expected - 1),
+                            (float('-inf'), float('inf'))):
+            board.expectimax(position, 3, alpha, beta, is_maximizing=False)
+        assert math.isclose(board.expectimax(position, 3, is_maximizing=False), expected, abs_tol=1e-9)
@@ -0,0 +1,174 @@
+"""Self-play tournament: scripted players against the adaptive Board AI on every core"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+import numpy as np
+import engine
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+class SimulatedClock:
+    """Game clock that only moves when a turn is played"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+def scripted_power_ups(game):
+    """Scripted player: use every power-up as soon as the cooldown allows"""
+    while game.player.power_ups:
+        if not game.use_power_up(0):
+            break
+
+def play_game(job):
+    """Play one complete game and return its result record"""
+    index, difficulty, seed, turn_seconds, max_turns, budgeted, overrides = job
+    random.seed(seed)
+    clock = SimulatedClock()
+    game = engine.Game(clock)
+    game.start_game(difficulty)
+    game.board.np_rng = np.random.default_rng(seed)
+    settings = game.board.difficulty_settings[difficulty]
+    if not budgeted:
+        # A wall-clock budget makes placements depend on machine load, fixed depth replays exactly
+        settings["search_budget_ms"] = None
+    settings.update(overrides)
+
+    turns = 0
+    snake_hits = 0
+    ladder_climbs = 0
+    immunity_saves = 0
+    placement_ms = []
+    while game.state == "playing" and turns < max_turns:
+        clock.advance(turn_seconds)
+        had_immunity = game.player.has_immunity
+
+        # Only turns that ran the placement search leave a timing behind
+        game.board.last_placement_ms = None
+        game.play_turn()
+        if game.state == "end" and game.time_left <= 0 and not game.player.win:
+            break  # Time ran out before the roll
+        turns += 1
+        if game.board.last_placement_ms is not None:
+            placement_ms.append(game.board.last_placement_ms)
+
+        if game.player.position < game.player.target_position:
+            snake_hits += 1
+        elif game.player.position > game.player.target_position:
+            ladder_climbs += 1
+        elif had_immunity and not game.player.has_immunity:
+            immunity_saves += 1
+        scripted_power_ups(game)
+
+    return {
+        "game": index,
+        "difficulty": difficulty,
+        "seed": seed,
+        "won": game.player.win,
+        "timed_out": game.state == "end" and not game.player.win,
+        "turns": turns,
+        "final_position": game.player.position,
+        "snake_hits": snake_hits,
+        "ladder_climbs": ladder_climbs,
+        "immunity_saves": immunity_saves,
+        "snakes_placed": len(game.board.snakes),
+        "ladders_placed": len(game.board.ladders),
+        "placement_ms": [round(ms, 3) for ms in placement_ms],
+        "time_left": round(game.time_left, 3)
+    }
+
+def play_game_quietly(job):
+    """play_game without the AI's placement logging"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return play_game(job)
+
+def parse_override(text):
+    """Parse a KEY=VALUE settings override, VALUE as JSON when possible"""
+    key, _, value = text.partition("=")
+    try:
+        value = json.loads(value)
+    except ValueError:
+        pass
+    return key, value
+
+def summarize(results, elapsed):
+    """Print win rate, turn counts and placement search cost per difficulty"""
+    print(f"{len(results)} games in {elapsed:.1f}s ({len(results) / elapsed:.1f} games/s)")
+    for difficulty in DIFFICULTIES:
+        games = [r for r in results if r["difficulty"] == difficulty]
+        if not games:
+            continue
+        wins = [r for r in games if r["won"]]
+        # Percentiles over every placement search, not over per-game means
+        placement_ms = sorted(ms for r in games for ms in r["placement_ms"])
+        placement_mean = statistics.mean(placement_ms) if placement_ms else 0.0
+        placement_p95 = placement_ms[int(len(placement_ms) * 0.95)] if placement_ms else 0.0
+        turns_to_win = statistics.median(r["turns"] for r in wins) if wins else float("nan")
+        print(f"{difficulty:>6}: win rate {len(wins) / len(games):6.1%}"
+              f" | turns to win (median) {turns_to_win:5.1f}"
+              f" | snake hits/game {statistics.mean(r['snake_hits'] for r in games):5.2f}"
+              f" | ladders/game {statistics.mean(r['ladder_climbs'] for r in games):5.2f}"
+              f" | placement ms mean {placement_mean:6.2f}"
+              f" p95 {placement_p95:6.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=300, help="Games per difficulty")
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, action="append",
+                        help="Difficulty to play, repeat for several (default: all)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--output", default="tournament_results.jsonl", help="JSON lines results file")
+    parser.add_argument("--seed", type=int, default=0, help="Base random seed")
+    parser.add_argument("--turn-seconds", type=float, default=2.0,
+                        help="Simulated seconds a turn takes, counts against the game timer")
+    parser.add_argument("--max-turns", type=int, default=1000, help="Turn limit per game")
+    parser.add_argument("--budgeted", action="store_true",
+                        help="Keep each difficulty's search_budget_ms, results then depend on machine speed")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override a difficulty_settings entry, e.g. --set search_budget_ms=4")
+    args = parser.parse_args()
+
+    overrides = dict(parse_override(text) for text in args.overrides)
+    jobs = []
+    for difficulty in args.difficulty or DIFFICULTIES:
+        for _ in range(args.games):
+            index = len(jobs)
+            jobs.append((index, difficulty, args.seed + index, args.turn_seconds, args.max_turns,
+                         args.budgeted, overrides))
+
+    results = []
+    start = time.perf_counter()
+    with open(args.output, "w") as output:
+        if args.workers > 1:
+            pool = multiprocessing.Pool(args.workers)
+            games = pool.imap_unordered(play_game_quietly, jobs)
+        else:
+            pool = None
+            games = map(play_game_quietly, jobs)
+
+        try:
+            for result in games:
+                # Stream every game as it completes
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+                results.append(result)
+                if len(results) % 100 == 0:
+                    print(f"{len(results)}/{len(jobs)} games", file=sys.stderr)
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+    summarize(results, time.perf_counter() - start)
+
+if __name__ == "__main__":
+    main()